@@ -1,16 +1,22 @@
-from fastapi import APIRouter, HTTPException, Query, Body
-from typing import List, Optional
+from fastapi import APIRouter, Body, Response
+from typing import List
 import logging
-from app.models.requests import CaseSearchRequest, IndustryTypeSearchRequest, JudgeSearchRequest
-from app.models.responses import StateResponse, CommissionResponse, CategoryResponse, JudgeResponse, CaseResponse
+from app.config import settings
+from app.models.requests import CaseSearchRequest, IndustryTypeSearchRequest, JudgeSearchRequest, ContextSearchRequest
+from app.models.responses import StateResponse, CommissionResponse, CategoryResponse, JudgeResponse, PaginatedCaseResponse, CaseSearchContextResponse
 from app.services.mapper_service import mapper_service
 from app.services.case_service import case_service
-from app.utils.exceptions import JagritiAPIException
 
+# Errors are not caught here: JagritiAPIException and anything unexpected reach
+# the exception handlers registered in app.main
 router = APIRouter(prefix="/api/v1", tags=["Case Search"])
 route_logger = logging.getLogger("app.routes")
 
 
+def _set_cache_headers(response: Response, ttl: int):
+    """Let clients and proxies reuse static lookup data for as long as we cache it"""
+    response.headers["Cache-Control"] = f"public, max-age={ttl}"
+
 
 @router.get(
     "/states",
@@ -21,18 +27,16 @@ route_logger = logging.getLogger("app.routes")
 async def get_states():
     """
     Get all available states/commissions.
+    
+    The JSON body is serialized once per cache refresh and returned as-is,
+    so response_model is only used for the OpenAPI schema.
     """
-    route_logger.info("📍 GET /states - Fetching all available states")
-    try:
-        states = await mapper_service.get_all_states()
-        route_logger.info(f"✅ GET /states - Returning {len(states)} states")
-        return states
-    except JagritiAPIException as e:
-        route_logger.error(f"🚨 GET /states - Jagriti API error: {e.message}")
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        route_logger.error(f"💥 GET /states - Unexpected error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    route_logger.debug("📍 GET /states - Fetching all available states")
+    body = await mapper_service.get_states_json()
+    route_logger.debug("✅ GET /states - Returning cached states payload (%d bytes)", len(body))
+    response = Response(content=body, media_type="application/json")
+    _set_cache_headers(response, settings.CACHE_TTL_STATES)
+    return response
 
 
 @router.get(
@@ -41,7 +45,7 @@ async def get_states():
     summary="Get commissions by state",
     description="Retrieve list of district commissions for a specific state"
 )
-async def get_commissions(state_id: int):
+async def get_commissions(state_id: int, response: Response):
     """
     Get all district commissions for a state.
     
@@ -51,13 +55,9 @@ async def get_commissions(state_id: int):
     Returns:
         List of district commissions. Empty list if state has no districts.
     """
-    try:
-        commissions = await mapper_service.get_commissions_by_state(state_id)
-        return commissions
-    except JagritiAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    commissions = await mapper_service.get_commissions_by_state(state_id)
+    _set_cache_headers(response, settings.CACHE_TTL_COMMISSIONS)
+    return commissions
 
 
 @router.get(
@@ -67,14 +67,11 @@ async def get_commissions(state_id: int):
     description="Retrieve list of all case categories/industry types"
 )
 async def get_categories():
-    """Get all available case categories."""
-    try:
-        categories = await mapper_service.get_all_categories()
-        return categories
-    except JagritiAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    """Get all available case categories (pre-serialized JSON, see get_states)."""
+    body = await mapper_service.get_categories_json()
+    response = Response(content=body, media_type="application/json")
+    _set_cache_headers(response, settings.CACHE_TTL_CATEGORIES)
+    return response
 
 
 @router.get(
@@ -83,153 +80,101 @@ async def get_categories():
     summary="Get judges by commission",
     description="Retrieve list of judges for a specific commission"
 )
-async def get_judges(commission_id: int):
+async def get_judges(commission_id: int, response: Response):
     """Get all judges for a commission."""
-    try:
-        judges = await mapper_service.get_judges_by_commission(commission_id)
-        return judges
-    except JagritiAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    judges = await mapper_service.get_judges_by_commission(commission_id)
+    _set_cache_headers(response, settings.CACHE_TTL_JUDGES)
+    return judges
 
 
 # ==================== CASE SEARCH ENDPOINTS ====================
 
-@router.post(
-    "/cases/by-case-number",
-    response_model=List[CaseResponse],
-    summary="Search cases by case number",
-    description="Search for cases by case number in District Consumer Courts"
-)
-async def search_by_case_number(request: CaseSearchRequest = Body(...)):
-    """
-    Search cases by case number.
-    
-    - **state**: State name (e.g., "KARNATAKA")
-    - **commission**: Commission name (e.g., "Bangalore 1st & Rural Additional")
-    - **search_value**: Case number to search for
-    - **from_date**: Start date (YYYY-MM-DD) - optional
-    - **to_date**: End date (YYYY-MM-DD) - optional
-    - **page**: Page number (0-indexed) - optional
-    - **size**: Page size (1-100) - optional
-    """
-    try:
-        cases = await case_service.search_by_case_number(request)
-        return cases
-    except JagritiAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-
-@router.post(
-    "/cases/by-complainant",
-    response_model=List[CaseResponse],
-    summary="Search cases by complainant name",
-    description="Search for cases by complainant name in District Consumer Courts"
-)
-async def search_by_complainant(request: CaseSearchRequest = Body(...)):
-    """Search cases by complainant name."""
-    try:
-        cases = await case_service.search_by_complainant(request)
-        return cases
-    except JagritiAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-
-@router.post(
-    "/cases/by-respondent",
-    response_model=List[CaseResponse],
-    summary="Search cases by respondent name",
-    description="Search for cases by respondent name in District Consumer Courts"
-)
-async def search_by_respondent(request: CaseSearchRequest = Body(...)):
-    """Search cases by respondent name."""
-    try:
-        cases = await case_service.search_by_respondent(request)
-        return cases
-    except JagritiAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-
-@router.post(
-    "/cases/by-complainant-advocate",
-    response_model=List[CaseResponse],
-    summary="Search cases by complainant advocate",
-    description="Search for cases by complainant advocate name in District Consumer Courts"
-)
-async def search_by_complainant_advocate(request: CaseSearchRequest = Body(...)):
-    """Search cases by complainant advocate name."""
-    try:
-        cases = await case_service.search_by_complainant_advocate(request)
-        return cases
-    except JagritiAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-
-@router.post(
-    "/cases/by-respondent-advocate",
-    response_model=List[CaseResponse],
-    summary="Search cases by respondent advocate",
-    description="Search for cases by respondent advocate name in District Consumer Courts"
+def _make_search_handler(service_method, request_model):
+    """Build a POST handler that validates `request_model` and delegates to a case_service method"""
+    async def handler(request: request_model = Body(...)):
+        return await service_method(request)
+    return handler
+
+
+# (path, route name, case_service method, request model, summary, description)
+SEARCH_ROUTES = [
+    (
+        "by-case-number", "search_by_case_number",
+        case_service.search_by_case_number, CaseSearchRequest,
+        "Search cases by case number",
+        "Search for cases by case number in District Consumer Courts"
+    ),
+    (
+        "by-complainant", "search_by_complainant",
+        case_service.search_by_complainant, CaseSearchRequest,
+        "Search cases by complainant name",
+        "Search for cases by complainant name in District Consumer Courts"
+    ),
+    (
+        "by-respondent", "search_by_respondent",
+        case_service.search_by_respondent, CaseSearchRequest,
+        "Search cases by respondent name",
+        "Search for cases by respondent name in District Consumer Courts"
+    ),
+    (
+        "by-complainant-advocate", "search_by_complainant_advocate",
+        case_service.search_by_complainant_advocate, CaseSearchRequest,
+        "Search cases by complainant advocate",
+        "Search for cases by complainant advocate name in District Consumer Courts"
+    ),
+    (
+        "by-respondent-advocate", "search_by_respondent_advocate",
+        case_service.search_by_respondent_advocate, CaseSearchRequest,
+        "Search cases by respondent advocate",
+        "Search for cases by respondent advocate name in District Consumer Courts"
+    ),
+    (
+        "by-industry-type", "search_by_industry_type",
+        case_service.search_by_industry_type, IndustryTypeSearchRequest,
+        "Search cases by industry type",
+        "Search for cases by industry category in District Consumer Courts. "
+        "Provide either category_name (e.g., \"BANKING\") or category_id; category_id takes precedence."
+    ),
+    (
+        "by-judge", "search_by_judge",
+        case_service.search_by_judge, JudgeSearchRequest,
+        "Search cases by judge",
+        "Search for cases by judge name in District Consumer Courts. "
+        "Provide either judge_name or judge_id; judge_id takes precedence."
+    ),
+]
+
+# page/size are forwarded verbatim to Jagriti, so the request models cap size at
+# MAX_PAGE_SIZE and only allow pages above DEFAULT_PAGE_SIZE with an explicit date range
+PAGE_SIZE_NOTE = (
+    f" Page size is capped at {settings.MAX_PAGE_SIZE}; sizes above {settings.DEFAULT_PAGE_SIZE} "
+    "require both from_date and to_date."
 )
-async def search_by_respondent_advocate(request: CaseSearchRequest = Body(...)):
-    """Search cases by respondent advocate name."""
-    try:
-        cases = await case_service.search_by_respondent_advocate(request)
-        return cases
-    except JagritiAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
 
-@router.post(
-    "/cases/by-industry-type",
-    response_model=List[CaseResponse],
-    summary="Search cases by industry type",
-    description="Search for cases by industry category in District Consumer Courts"
-)
-async def search_by_industry_type(request: IndustryTypeSearchRequest = Body(...)):
-    """
-    Search cases by industry type/category.
-    
-    You can provide either category_name (e.g., "BANKING") or category_id.
-    If both are provided, category_id takes precedence.
-    """
-    try:
-        cases = await case_service.search_by_industry_type(request)
-        return cases
-    except JagritiAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+for path, name, service_method, request_model, summary, description in SEARCH_ROUTES:
+    router.add_api_route(
+        f"/cases/{path}",
+        _make_search_handler(service_method, request_model),
+        methods=["POST"],
+        response_model=PaginatedCaseResponse,
+        name=name,
+        summary=summary,
+        description=description.rstrip(".") + "." + PAGE_SIZE_NOTE
+    )
 
 
 @router.post(
-    "/cases/by-judge",
-    response_model=List[CaseResponse],
-    summary="Search cases by judge",
-    description="Search for cases by judge name in District Consumer Courts"
+    "/cases/search-with-context",
+    response_model=CaseSearchContextResponse,
+    summary="Search cases with resolved context",
+    description="Resolve state, commission, category and judge and search cases in one request. "
+                "Independent lookups run concurrently; lookups that fail are listed in errors "
+                "alongside the resolved ones and the case search is skipped."
 )
-async def search_by_judge(request: JudgeSearchRequest = Body(...)):
+async def search_with_context(request: ContextSearchRequest = Body(...)):
     """
-    Search cases by judge.
+    Search cases and return the resolved lookup context alongside the results.
     
-    You can provide either judge_name or judge_id.
-    If both are provided, judge_id takes precedence.
+    Saves clients the /states -> /commissions -> /judges -> /cases/by-* round trips.
     """
-    try:
-        cases = await case_service.search_by_judge(request)
-        return cases
-    except JagritiAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return await case_service.search_with_context(request)
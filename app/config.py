@@ -20,22 +20,36 @@ class Settings(BaseSettings):
     CACHE_TTL_JUDGES: int = 21600  # 6 hours
     CACHE_TTL_CASES: int = 300  # 5 minutes
     
+    # How long expired states/categories/commissions may still be served
+    # while a background refresh fetches fresh data (stale-while-revalidate)
+    CACHE_STALE_GRACE: int = 3600  # 1 hour
+    
     # HTTP Client Settings
     REQUEST_TIMEOUT: int = 300
+    CONNECT_TIMEOUT: int = 10  # also the wait for a free pooled connection
     MAX_RETRIES: int = 3
     MAX_CONCURRENT_REQUESTS: int = 10
     
+    # Logging: jagriti_api.log is rotated in-process, which is only safe with a single process.
+    # Set when running several workers and let an external logrotate rotate the file instead.
+    LOG_EXTERNAL_ROTATION: bool = False
+    
     # Pagination defaults
     DEFAULT_PAGE_SIZE: int = 30
     MAX_PAGE_SIZE: int = 100
     
     model_config = {
         "case_sensitive": True,
-        "extra": "allow"
+        "extra": "allow",
+        "frozen": True
     }
 
 
 @lru_cache()
 def get_settings() -> Settings:
     """Get cached settings instance"""
-    return Settings()
\ No newline at end of file
+    return Settings()
+
+
+# Module-level instance; import this instead of calling get_settings() on hot paths
+settings = get_settings()
\ No newline at end of file
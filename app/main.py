@@ -1,43 +1,70 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from app.config import get_settings
+from fastapi.responses import ORJSONResponse
+from app.config import settings
 from app.api.routes import cases
 from app.utils.exceptions import JagritiAPIException
 from app.services.cache_service import cache
+from app.services.jagriti_client import jagriti_client
 from app.utils.logging_config import logger
 import logging
 import time
 
-# Get settings
-settings = get_settings()
-
 # Application logger
 app_logger = logging.getLogger("app.main")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared resources on startup and release them on shutdown"""
+    await jagriti_client.start()
+    # Build the OpenAPI schema now (FastAPI caches it) so the first /docs hit doesn't pay for it
+    app_logger.info("📘 Generating OpenAPI schema")
+    app.openapi()
+    yield
+    await jagriti_client.aclose()
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="API wrapper for Jagriti Consumer Courts portal",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 app_logger.info(f"🚀 Starting {settings.APP_NAME} v{settings.APP_VERSION}")
 app_logger.info(f"📊 Debug mode: {settings.DEBUG}")
 app_logger.info(f"🌐 Jagriti API base URL: {settings.JAGRITI_BASE_URL}")
 
+# High-frequency paths (load balancer pings, root probe) that are not worth a log line
+UNLOGGED_PATHS = frozenset({"/health", "/"})
+
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    start_time = time.time()
+    # Skip client/path lookups entirely when INFO logging is silenced
+    if not app_logger.isEnabledFor(logging.INFO):
+        return await call_next(request)
+    
+    method = request.method
+    path = request.url.path
+    # CORS preflights and health checks go straight through
+    if method == "OPTIONS" or path in UNLOGGED_PATHS:
+        return await call_next(request)
+    
+    start = time.perf_counter_ns()
     client_ip = request.client.host if request.client else "unknown"
     
-    app_logger.info(f"📥 {request.method} {request.url.path} - Client: {client_ip}")
+    app_logger.info("📥 %s %s - Client: %s", method, path, client_ip)
     
     response = await call_next(request)
     
-    process_time = time.time() - start_time
-    app_logger.info(f"📤 {request.method} {request.url.path} - Status: {response.status_code} - Time: {process_time:.3f}s")
+    process_time = (time.perf_counter_ns() - start) / 1e9
+    app_logger.info("📤 %s %s - Status: %s - Time: %.3fs", method, path, response.status_code, process_time)
     
     return response
 
@@ -56,7 +83,7 @@ app_logger.info("🔧 CORS middleware configured")
 async def jagriti_exception_handler(request: Request, exc: JagritiAPIException):
     """Handle Jagriti API exceptions"""
     app_logger.error(f"🚨 Jagriti API Exception: {exc.message} - Status: {exc.status_code} - Path: {request.url.path}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -70,7 +97,7 @@ async def jagriti_exception_handler(request: Request, exc: JagritiAPIException):
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle all other exceptions"""
     app_logger.error(f"💥 Unhandled Exception: {str(exc)} - Path: {request.url.path}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
@@ -120,10 +147,14 @@ async def get_cache_stats():
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        # uvloop has no Windows build; fall back to the stdlib event loop there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
\ No newline at end of file
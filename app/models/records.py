@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Union
+
+
+@dataclass(frozen=True, slots=True)
+class CommissionRecord:
+    """A state or district commission (states are state-level commissions in Jagriti)"""
+    
+    commission_id: int
+    commission_name: str
+    is_circuit_bench: bool
+    is_active: bool
+    name_norm: str  # Normalized name used for matching, never returned to clients
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryRecord:
+    """A case category / industry type"""
+    
+    category_id: int
+    category_name: str
+    name_norm: str
+
+
+@dataclass(frozen=True, slots=True)
+class JudgeRecord:
+    """A judge sitting at a commission"""
+    
+    judge_id: int
+    judge_name: str
+    commission_id: int
+    name_norm: str
+
+
+# Any record a name lookup can return
+LookupRecord = Union[CommissionRecord, CategoryRecord, JudgeRecord]
@@ -1,18 +1,56 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator, model_validator, AfterValidator
+from typing import Optional, Annotated, Literal
 from datetime import date
+from app.config import settings
 
 
-class CaseSearchRequest(BaseModel):
+def _validate_date(v: Optional[str]) -> Optional[str]:
+    """Validate date format"""
+    if v is None:
+        return None
+    try:
+        date.fromisoformat(v)
+        return v
+    except ValueError:
+        raise ValueError("Date must be in YYYY-MM-DD format")
+
+
+# Optional YYYY-MM-DD string shared by every search request model
+DateStr = Annotated[Optional[str], AfterValidator(_validate_date)]
+
+
+_SIZE_DESCRIPTION = (
+    f"Page size, sent to Jagriti as-is (max {settings.MAX_PAGE_SIZE}; "
+    f"above {settings.DEFAULT_PAGE_SIZE} requires from_date and to_date)"
+)
+
+
+class _PagedSearchRequest(BaseModel):
+    """Date range and pagination fields shared by every case search request"""
+    
+    from_date: DateStr = Field(None, description="Start date in YYYY-MM-DD format")
+    to_date: DateStr = Field(None, description="End date in YYYY-MM-DD format")
+    page: int = Field(0, ge=0, description="Page number (0-indexed)")
+    size: int = Field(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE, description=_SIZE_DESCRIPTION)
+    cursor: Optional[str] = Field(None, description="Opaque next_cursor from a previous response; overrides page and size")
+    
+    @model_validator(mode="after")
+    def check_page_size(self):
+        """Only allow pages larger than the default when an explicit date range narrows the upstream query"""
+        has_date_range = self.from_date is not None and self.to_date is not None
+        if not has_date_range and self.size > settings.DEFAULT_PAGE_SIZE:
+            raise ValueError(
+                f"size greater than {settings.DEFAULT_PAGE_SIZE} requires both from_date and to_date"
+            )
+        return self
+
+
+class CaseSearchRequest(_PagedSearchRequest):
     """Base request model for case searches"""
     
     state: str = Field(..., description="State name (e.g., 'GUJARAT')")
     commission: str = Field(..., description="Commission name (e.g., 'Ahmedabad City')")
     search_value: str = Field(..., description="Search value (case number, name, etc.)")
-    from_date: Optional[str] = Field(None, description="Start date in YYYY-MM-DD format")
-    to_date: Optional[str] = Field(None, description="End date in YYYY-MM-DD format")
-    page: Optional[int] = Field(0, ge=0, description="Page number (0-indexed)")
-    size: Optional[int] = Field(30, ge=1, le=100, description="Page size")
     
     @field_validator('state', 'commission', 'search_value')
     @classmethod
@@ -20,20 +58,8 @@ class CaseSearchRequest(BaseModel):
         """Remove leading/trailing whitespace"""
         return v.strip()
     
-    @field_validator('from_date', 'to_date')
-    @classmethod
-    def validate_date_format(cls, v: Optional[str]) -> Optional[str]:
-        """Validate date format"""
-        if v is None:
-            return None
-        try:
-            date.fromisoformat(v)
-            return v
-        except ValueError:
-            raise ValueError("Date must be in YYYY-MM-DD format")
-    
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "json_schema_extra": {
             "example": {
                 "state": "GUJARAT",
                 "commission": "Ahmedabad City",
@@ -44,33 +70,19 @@ class CaseSearchRequest(BaseModel):
                 "size": 30
             }
         }
+    }
 
 
-class IndustryTypeSearchRequest(BaseModel):
+class IndustryTypeSearchRequest(_PagedSearchRequest):
     """Request for searching by industry type"""
     
     state: str = Field(..., description="State name")
     commission: str = Field(..., description="Commission name")
     category_name: Optional[str] = Field(None, description="Industry category name (e.g., 'BANKING')")
     category_id: Optional[int] = Field(None, description="Industry category ID")
-    from_date: Optional[str] = Field(None, description="Start date in YYYY-MM-DD format")
-    to_date: Optional[str] = Field(None, description="End date in YYYY-MM-DD format")
-    page: Optional[int] = Field(0, ge=0)
-    size: Optional[int] = Field(30, ge=1, le=100)
-    
-    @field_validator('from_date', 'to_date')
-    @classmethod
-    def validate_date_format(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return None
-        try:
-            date.fromisoformat(v)
-            return v
-        except ValueError:
-            raise ValueError("Date must be in YYYY-MM-DD format")
     
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "json_schema_extra": {
             "example": {
                 "state": "GUJARAT",
                 "commission": "Ahmedabad City",
@@ -79,38 +91,78 @@ class IndustryTypeSearchRequest(BaseModel):
                 "to_date": "2025-09-30"
             }
         }
+    }
 
 
-class JudgeSearchRequest(BaseModel):
+class JudgeSearchRequest(_PagedSearchRequest):
     """Request for searching by judge"""
     
     state: str = Field(..., description="State name")
     commission: str = Field(..., description="Commission name")
     judge_name: Optional[str] = Field(None, description="Judge name")
     judge_id: Optional[int] = Field(None, description="Judge ID")
-    from_date: Optional[str] = Field(None, description="Start date in YYYY-MM-DD format")
-    to_date: Optional[str] = Field(None, description="End date in YYYY-MM-DD format")
-    page: Optional[int] = Field(0, ge=0)
-    size: Optional[int] = Field(30, ge=1, le=100)
     
-    @field_validator('from_date', 'to_date')
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "state": "GUJARAT",
+                "commission": "Ahmedabad City",
+                "judge_name": "M.H.PATEL",
+                "from_date": "2025-01-01",
+                "to_date": "2025-09-30"
+            }
+        }
+    }
+
+
+# Search criteria accepted by the composite search endpoint
+SearchBy = Literal[
+    "case_number", "complainant", "respondent",
+    "complainant_advocate", "respondent_advocate",
+    "industry_type", "judge"
+]
+
+
+class ContextSearchRequest(_PagedSearchRequest):
+    """Request for searching cases and resolving their lookup context in one call"""
+    
+    state: str = Field(..., description="State name")
+    commission: str = Field(..., description="Commission name")
+    search_by: SearchBy = Field(..., description="Search criterion")
+    search_value: Optional[str] = Field(None, description="Search value (required for name/number searches)")
+    category_name: Optional[str] = Field(None, description="Industry category name (industry_type search)")
+    category_id: Optional[int] = Field(None, description="Industry category ID (industry_type search)")
+    judge_name: Optional[str] = Field(None, description="Judge name (judge search)")
+    judge_id: Optional[int] = Field(None, description="Judge ID (judge search)")
+    
+    @field_validator('state', 'commission')
     @classmethod
-    def validate_date_format(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return None
-        try:
-            date.fromisoformat(v)
-            return v
-        except ValueError:
-            raise ValueError("Date must be in YYYY-MM-DD format")
+    def strip_whitespace(cls, v: str) -> str:
+        """Remove leading/trailing whitespace"""
+        return v.strip()
     
-    class Config:
-        json_schema_extra = {
+    @model_validator(mode="after")
+    def check_search_criteria(self):
+        """Require the inputs the chosen search criterion needs"""
+        if self.search_by == "industry_type":
+            if self.category_id is None and not self.category_name:
+                raise ValueError("industry_type search requires category_name or category_id")
+        elif self.search_by == "judge":
+            if self.judge_id is None and not self.judge_name:
+                raise ValueError("judge search requires judge_name or judge_id")
+        elif not self.search_value or not self.search_value.strip():
+            raise ValueError(f"{self.search_by} search requires search_value")
+        return self
+    
+    model_config = {
+        "json_schema_extra": {
             "example": {
                 "state": "GUJARAT",
                 "commission": "Ahmedabad City",
+                "search_by": "judge",
                 "judge_name": "M.H.PATEL",
                 "from_date": "2025-01-01",
                 "to_date": "2025-09-30"
             }
-        }
\ No newline at end of file
+        }
+    }
\ No newline at end of file
@@ -10,8 +10,9 @@ class StateResponse(BaseModel):
     is_circuit_bench: bool
     is_active: bool
     
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "from_attributes": True,
+        "json_schema_extra": {
             "example": {
                 "commission_id": 11240000,
                 "commission_name": "GUJARAT",
@@ -19,6 +20,7 @@ class StateResponse(BaseModel):
                 "is_active": True
             }
         }
+    }
 
 
 class CommissionResponse(BaseModel):
@@ -29,8 +31,9 @@ class CommissionResponse(BaseModel):
     is_circuit_bench: bool
     is_active: bool
     
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "from_attributes": True,
+        "json_schema_extra": {
             "example": {
                 "commission_id": 11240438,
                 "commission_name": "Ahmedabad City",
@@ -38,6 +41,7 @@ class CommissionResponse(BaseModel):
                 "is_active": True
             }
         }
+    }
 
 
 class CategoryResponse(BaseModel):
@@ -46,13 +50,15 @@ class CategoryResponse(BaseModel):
     category_id: int
     category_name: str
     
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "from_attributes": True,
+        "json_schema_extra": {
             "example": {
                 "category_id": 43,
                 "category_name": "BANKING"
             }
         }
+    }
 
 
 class JudgeResponse(BaseModel):
@@ -62,14 +68,16 @@ class JudgeResponse(BaseModel):
     judge_name: str
     commission_id: int
     
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "from_attributes": True,
+        "json_schema_extra": {
             "example": {
                 "judge_id": 11446,
                 "judge_name": "HON'BLE MR. President M.H.PATEL",
                 "commission_id": 12240438
             }
         }
+    }
 
 
 class CaseResponse(BaseModel):
@@ -84,8 +92,9 @@ class CaseResponse(BaseModel):
     respondent_advocate: Optional[str] = None
     document_link: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "from_attributes": True,
+        "json_schema_extra": {
             "example": {
                 "case_number": "DC/AB1/484/CC/21/344",
                 "case_stage": "ALLOWED",
@@ -97,37 +106,103 @@ class CaseResponse(BaseModel):
                 "document_link": "base64_encoded_document"
             }
         }
+    }
 
 
-class ErrorResponse(BaseModel):
-    """Response model for API errors"""
+class PaginatedCaseResponse(BaseModel):
+    """Response model for one page of case search results"""
     
-    success: bool = False
+    items: List[CaseResponse]
+    next_cursor: Optional[str] = None
+    
+    model_config = {
+        "from_attributes": True,
+        "json_schema_extra": {
+            "example": {
+                "items": [
+                    {
+                        "case_number": "DC/AB1/484/CC/21/344",
+                        "case_stage": "ALLOWED",
+                        "filing_date": "2021-12-28",
+                        "complainant": "SMT. DARSHANA MAHESH ROSHANKHEDE"
+                    }
+                ],
+                "next_cursor": "eyJwIjoxLCJzIjozMH0="
+            }
+        }
+    }
+
+
+class LookupErrorResponse(BaseModel):
+    """Response model for a lookup that could not be resolved"""
+    
+    lookup: str
     message: str
-    error: Optional[str] = None
+    status_code: int
     
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "json_schema_extra": {
             "example": {
-                "success": False,
-                "message": "State 'INVALID_STATE' not found",
-                "error": "StateNotFoundException"
+                "lookup": "judge",
+                "message": "Judge 'M.H.PATIL' not found",
+                "status_code": 404
+            }
+        }
+    }
+
+
+class CaseSearchContextResponse(PaginatedCaseResponse):
+    """Response model for a case search together with the resolved lookup context"""
+    
+    state: StateResponse
+    commission: Optional[CommissionResponse] = None
+    category: Optional[CategoryResponse] = None
+    judge: Optional[JudgeResponse] = None
+    errors: List[LookupErrorResponse] = Field(default_factory=list)
+    
+    model_config = {
+        "from_attributes": True,
+        "json_schema_extra": {
+            "example": {
+                "state": {
+                    "commission_id": 11240000,
+                    "commission_name": "GUJARAT",
+                    "is_circuit_bench": False,
+                    "is_active": True
+                },
+                "commission": {
+                    "commission_id": 11240438,
+                    "commission_name": "Ahmedabad City",
+                    "is_circuit_bench": False,
+                    "is_active": True
+                },
+                "category": None,
+                "judge": {
+                    "judge_id": 11446,
+                    "judge_name": "HON'BLE MR. President M.H.PATEL",
+                    "commission_id": 11240438
+                },
+                "items": [],
+                "next_cursor": None,
+                "errors": []
             }
         }
+    }
 
 
 class ErrorResponse(BaseModel):
-    """Error response model"""
+    """Response model for API errors"""
     
     success: bool = False
     message: str
     error: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "json_schema_extra": {
             "example": {
                 "success": False,
-                "message": "Failed to fetch data",
-                "error": "State not found"
+                "message": "State 'INVALID_STATE' not found",
+                "error": "StateNotFoundException"
             }
-        }
\ No newline at end of file
+        }
+    }
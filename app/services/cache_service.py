@@ -1,9 +1,11 @@
-from typing import Optional, Any
-from datetime import datetime, timedelta
-import hashlib
-import json
+from typing import Optional, Any, Tuple, Dict, Hashable, AsyncIterator
+from contextlib import asynccontextmanager
+import asyncio
 import logging
+import time
+import zlib
 from cachetools import TTLCache
+from app.config import settings
 
 
 class CacheService:
@@ -11,138 +13,230 @@ class CacheService:
     
     def __init__(self):
         self.logger = logging.getLogger("app.cache")
+        self.settings = settings
+        grace = settings.CACHE_STALE_GRACE
         
-        # Static data caches (simple variables with timestamps)
-        self.states_cache: Optional[Any] = None
-        self.states_cache_time: Optional[datetime] = None
+        # Static data caches (single-slot, expiry tracked on the monotonic clock).
+        # Entries outlive their TTL by the stale grace period so they can be served
+        # while a refresh runs; each one is stored as (data, fresh_until) so its
+        # freshness is evicted together with it.
+        self.states_cache = TTLCache(maxsize=1, ttl=settings.CACHE_TTL_STATES + grace)
+        self.categories_cache = TTLCache(maxsize=1, ttl=settings.CACHE_TTL_CATEGORIES + grace)
         
-        self.categories_cache: Optional[Any] = None
-        self.categories_cache_time: Optional[datetime] = None
+        # Dynamic data with TTL and LRU eviction (slot-based), keyed by the raw int ID.
+        # All access happens on the event loop thread and every cache is small and
+        # bounded, so get/set (including expiry, which runs in insertion order) never
+        # awaits and costs microseconds; an async cache would only add awaits.
+        self.commissions_cache = TTLCache(maxsize=50, ttl=settings.CACHE_TTL_COMMISSIONS + grace)
+        self.judges_cache = TTLCache(maxsize=100, ttl=settings.CACHE_TTL_JUDGES)
+        self.cases_cache = TTLCache(maxsize=200, ttl=settings.CACHE_TTL_CASES)
+        # Whether a state has district commissions at all; this rarely changes, so it is kept
+        # as long as the states list and outlives the commissions entries it is derived from
+        self.has_districts_cache = TTLCache(maxsize=50, ttl=settings.CACHE_TTL_STATES)
         
-        # Dynamic data with TTL and LRU eviction (slot-based)
-        self.commissions_cache = TTLCache(maxsize=50, ttl=21600)  # 6 hours
-        self.judges_cache = TTLCache(maxsize=100, ttl=21600)  # 6 hours
-        self.cases_cache = TTLCache(maxsize=200, ttl=300)  # 5 minutes
+        self.logger.info(
+            f"🗄️ Cache service initialized - States: {settings.CACHE_TTL_STATES}s, Categories: {settings.CACHE_TTL_CATEGORIES}s, "
+            f"Commissions: {settings.CACHE_TTL_COMMISSIONS}s, Judges: {settings.CACHE_TTL_JUDGES}s, Cases: {settings.CACHE_TTL_CASES}s"
+        )
         
-        self.logger.info("🗄️ Cache service initialized - States: Manual TTL, Commissions: 6h, Judges: 6h, Cases: 5min")
+        # Per-key locks (refreshes, judge and case fetches), with how many callers hold or
+        # await each; an entry is dropped once its last user is done, so only in-flight keys stay
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._lock_users: Dict[Hashable, int] = {}
+        
+        # Serialized JSON bodies for the static-data endpoints, dropped whenever the data changes
+        self.states_response: Optional[bytes] = None
+        self.categories_response: Optional[bytes] = None
+    
+    def _generate_cache_key(self, **kwargs) -> Tuple[Tuple[str, Any], ...]:
+        """Generate unique cache key from parameters (values must be hashable)"""
+        return tuple(sorted(kwargs.items()))
+    
+    def _format_key(self, key: Tuple[Tuple[str, Any], ...]) -> str:
+        """Short printable form of a cache key for log lines (stable across workers and restarts)"""
+        return f"{zlib.crc32(repr(key).encode()):08x}"
+    
+    # ==================== FRESHNESS / REFRESH ====================
+    
+    def _slot(self, key: Hashable) -> Tuple[TTLCache, Hashable]:
+        """Cache and slot of a logical entry ("states", "categories", ("commissions", state_id))"""
+        if key == "states":
+            return self.states_cache, key
+        if key == "categories":
+            return self.categories_cache, key
+        return self.commissions_cache, key[1]
+    
+    def _get_entry(self, key: Hashable) -> Optional[Any]:
+        """Data of a logical entry, fresh or stale (None if missing or expired)"""
+        store, slot = self._slot(key)
+        entry = store.get(slot)
+        return entry[0] if entry is not None else None
     
-    def _is_cache_valid(self, cache_time: Optional[datetime], ttl_seconds: int) -> bool:
-        """Check if cache is still valid based on TTL"""
-        if cache_time is None:
-            return False
-        return datetime.now() - cache_time < timedelta(seconds=ttl_seconds)
+    def _set_entry(self, key: Hashable, data: Any, ttl: int):
+        """Store a logical entry together with when it stops being fresh"""
+        store, slot = self._slot(key)
+        store[slot] = (data, time.monotonic() + ttl)
     
-    def _generate_cache_key(self, **kwargs) -> str:
-        """Generate unique cache key from parameters"""
-        key_string = json.dumps(kwargs, sort_keys=True)
-        return hashlib.md5(key_string.encode()).hexdigest()
+    def is_stale(self, key: Hashable) -> bool:
+        """Check if an entry is past its TTL (it may still be served during the grace period)"""
+        store, slot = self._slot(key)
+        entry = store.get(slot)
+        return entry is None or time.monotonic() >= entry[1]
+    
+    def refresh_lock(self, key: Hashable):
+        """Lock guarding the upstream refresh of an entry, so only one fetch is in flight"""
+        return self._hold_lock(key)
+    
+    def is_refreshing(self, key: Hashable) -> bool:
+        """Check if a refresh of an entry is running or waiting for the lock"""
+        return key in self._locks
+    
+    @asynccontextmanager
+    async def _hold_lock(self, key: Hashable) -> AsyncIterator[None]:
+        """Hold the lock for a key, creating it on first use and dropping it after its last user"""
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        # Counted before acquiring, so woken waiters that have not run yet keep the lock alive
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            users = self._lock_users[key] - 1
+            if users:
+                self._lock_users[key] = users
+            else:
+                del self._lock_users[key]
+                del self._locks[key]
     
     # ==================== STATES CACHE ====================
     
     def get_states(self) -> Optional[Any]:
-        """Get cached states list"""
-        if self.states_cache is not None:
+        """Get cached states list (None if missing or expired)"""
+        data = self._get_entry("states")
+        if data is not None:
             self.logger.debug("🎯 CACHE HIT: States data retrieved from cache")
-            return self.states_cache
+            return data
         self.logger.debug("❌ CACHE MISS: States data not in cache")
         return None
     
     def set_states(self, data: Any):
         """Set states cache"""
-        self.states_cache = data
-        self.states_cache_time = datetime.now()
+        self._set_entry("states", data, self.settings.CACHE_TTL_STATES)
+        self.states_response = None
         self.logger.info(f"💾 CACHE SET: States data cached ({len(data) if isinstance(data, list) else 'N/A'} items)")
     
-    def is_states_valid(self, ttl: int) -> bool:
-        """Check if states cache is valid"""
-        is_valid = self._is_cache_valid(self.states_cache_time, ttl)
-        if is_valid:
-            self.logger.debug(f"✅ States cache is VALID (TTL: {ttl}s)")
-        else:
-            self.logger.debug(f"⏰ States cache is EXPIRED (TTL: {ttl}s)")
-        return is_valid
+    def get_states_response(self) -> Optional[bytes]:
+        """Get serialized JSON body for the current states data"""
+        return self.states_response
+    
+    def set_states_response(self, body: bytes):
+        """Set serialized JSON body for the current states data"""
+        self.states_response = body
+        self.logger.debug("💾 CACHE SET: States response body cached (%d bytes)", len(body))
     
     # ==================== CATEGORIES CACHE ====================
     
     def get_categories(self) -> Optional[Any]:
-        """Get cached categories list"""
-        if self.categories_cache is not None:
+        """Get cached categories list (None if missing or expired)"""
+        data = self._get_entry("categories")
+        if data is not None:
             self.logger.debug("🎯 CACHE HIT: Categories data retrieved from cache")
-            return self.categories_cache
+            return data
         self.logger.debug("❌ CACHE MISS: Categories data not in cache")
         return None
     
     def set_categories(self, data: Any):
         """Set categories cache"""
-        self.categories_cache = data
-        self.categories_cache_time = datetime.now()
+        self._set_entry("categories", data, self.settings.CACHE_TTL_CATEGORIES)
+        self.categories_response = None
         self.logger.info(f"💾 CACHE SET: Categories data cached ({len(data) if isinstance(data, list) else 'N/A'} items)")
     
-    def is_categories_valid(self, ttl: int) -> bool:
-        """Check if categories cache is valid"""
-        return self._is_cache_valid(self.categories_cache_time, ttl)
+    def get_categories_response(self) -> Optional[bytes]:
+        """Get serialized JSON body for the current categories data"""
+        return self.categories_response
+    
+    def set_categories_response(self, body: bytes):
+        """Set serialized JSON body for the current categories data"""
+        self.categories_response = body
+        self.logger.debug("💾 CACHE SET: Categories response body cached (%d bytes)", len(body))
     
     # ==================== COMMISSIONS CACHE ====================
     
     def get_commissions(self, state_id: int) -> Optional[Any]:
         """Get cached commissions for a state"""
-        key = f"commissions_{state_id}"
-        data = self.commissions_cache.get(key)
+        data = self._get_entry(("commissions", state_id))
         if data is not None:
-            self.logger.debug(f"🎯 CACHE HIT: Commissions for state {state_id} retrieved from cache")
+            self.logger.debug("🎯 CACHE HIT: Commissions for state %s retrieved from cache", state_id)
             return data
-        self.logger.debug(f"❌ CACHE MISS: Commissions for state {state_id} not in cache")
+        self.logger.debug("❌ CACHE MISS: Commissions for state %s not in cache", state_id)
         return None
     
     def set_commissions(self, state_id: int, data: Any):
         """Set commissions cache for a state"""
-        key = f"commissions_{state_id}"
-        self.commissions_cache[key] = data
+        self._set_entry(("commissions", state_id), data, self.settings.CACHE_TTL_COMMISSIONS)
         self.logger.info(f"💾 CACHE SET: Commissions for state {state_id} cached ({len(data) if isinstance(data, list) else 'N/A'} items)")
     
+    def get_has_districts(self, state_id: int) -> Optional[bool]:
+        """Get whether a state has district commissions (None if unknown)"""
+        return self.has_districts_cache.get(state_id)
+    
+    def set_has_districts(self, state_id: int, has_districts: bool):
+        """Record whether a state has district commissions"""
+        self.has_districts_cache[state_id] = has_districts
+    
     # ==================== JUDGES CACHE ====================
     
     def get_judges(self, commission_id: int) -> Optional[Any]:
         """Get cached judges for a commission"""
-        key = f"judges_{commission_id}"
-        data = self.judges_cache.get(key)
+        data = self.judges_cache.get(commission_id)
         if data is not None:
-            self.logger.debug(f"🎯 CACHE HIT: Judges for commission {commission_id} retrieved from cache")
+            self.logger.debug("🎯 CACHE HIT: Judges for commission %s retrieved from cache", commission_id)
             return data
-        self.logger.debug(f"❌ CACHE MISS: Judges for commission {commission_id} not in cache")
+        self.logger.debug("❌ CACHE MISS: Judges for commission %s not in cache", commission_id)
         return None
     
     def set_judges(self, commission_id: int, data: Any):
         """Set judges cache for a commission"""
-        key = f"judges_{commission_id}"
-        self.judges_cache[key] = data
+        self.judges_cache[commission_id] = data
         self.logger.info(f"💾 CACHE SET: Judges for commission {commission_id} cached ({len(data) if isinstance(data, list) else 'N/A'} items)")
     
+    def judges_lock(self, commission_id: int):
+        """Lock serializing upstream fetches of one commission's judges (IDs come from the request path)"""
+        return self._hold_lock(("judges", commission_id))
+    
     # ==================== CASE RESULTS CACHE ====================
     
     def get_cases(self, **params) -> Optional[Any]:
         """Get cached case search results"""
         key = self._generate_cache_key(**params)
         data = self.cases_cache.get(key)
-        if data is not None:
-            self.logger.debug(f"🎯 CACHE HIT: Case search results retrieved from cache (key: {key[:12]}...)")
-            return data
-        self.logger.debug(f"❌ CACHE MISS: Case search results not in cache (key: {key[:12]}...)")
-        return None
+        # The printable key costs a repr and checksum, so only build it when the line will be emitted
+        if self.logger.isEnabledFor(logging.DEBUG):
+            if data is not None:
+                self.logger.debug("🎯 CACHE HIT: Case search results retrieved from cache (key: %s)", self._format_key(key))
+            else:
+                self.logger.debug("❌ CACHE MISS: Case search results not in cache (key: %s)", self._format_key(key))
+        return data
     
     def set_cases(self, data: Any, **params):
         """Set case search results cache"""
         key = self._generate_cache_key(**params)
         self.cases_cache[key] = data
-        self.logger.info(f"💾 CACHE SET: Case search results cached ({len(data) if isinstance(data, list) else 'N/A'} items, key: {key[:12]}...)")
+        self.logger.info(f"💾 CACHE SET: Case search results cached ({len(data) if isinstance(data, list) else 'N/A'} items, key: {self._format_key(key)})")
+    
+    def cases_lock(self, **params):
+        """Lock serializing upstream fetches of one case search, so identical misses share a call"""
+        return self._hold_lock(("cases", self._generate_cache_key(**params)))
     
     # ==================== CACHE MANAGEMENT ====================
     
     def get_stats(self) -> dict:
         """Get cache statistics"""
         return {
-            "states_cached": self.states_cache is not None,
-            "categories_cached": self.categories_cache is not None,
+            "states_cached": "states" in self.states_cache,
+            "categories_cached": "categories" in self.categories_cache,
             "commissions_count": len(self.commissions_cache),
             "judges_count": len(self.judges_cache),
             "cases_count": len(self.cases_cache),
@@ -151,11 +245,12 @@ class CacheService:
     def clear_all(self):
         """Clear all caches"""
         self.logger.warning("🧹 CACHE CLEAR: Clearing all cached data")
-        self.states_cache = None
-        self.states_cache_time = None
-        self.categories_cache = None
-        self.categories_cache_time = None
+        self.states_cache.clear()
+        self.categories_cache.clear()
+        self.states_response = None
+        self.categories_response = None
         self.commissions_cache.clear()
+        self.has_districts_cache.clear()
         self.judges_cache.clear()
         self.cases_cache.clear()
         self.logger.info("✅ All caches cleared successfully")
@@ -1,44 +1,90 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Awaitable, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache, partialmethod
+import asyncio
 import logging
 from app.services.jagriti_client import jagriti_client
 from app.services.mapper_service import mapper_service
 from app.services.cache_service import cache
-from app.models.requests import CaseSearchRequest, IndustryTypeSearchRequest, JudgeSearchRequest
-from app.models.responses import CaseResponse
-from app.utils.exceptions import JagritiAPIException, CaseDataException
-from app.config import get_settings
+from app.models.requests import CaseSearchRequest, IndustryTypeSearchRequest, JudgeSearchRequest, ContextSearchRequest
+from app.models.responses import CaseResponse, PaginatedCaseResponse, CaseSearchContextResponse, LookupErrorResponse
+from app.utils.exceptions import JagritiAPIException, CaseDataException, PageSizeException
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.config import settings
+
+
+# search_by value of ContextSearchRequest -> Jagriti search type
+SEARCH_TYPES = {
+    "case_number": 1, "complainant": 2, "respondent": 3,
+    "complainant_advocate": 4, "respondent_advocate": 5,
+    "industry_type": 6, "judge": 7
+}
+
+# Jagriti search type -> display name for log lines
+SEARCH_TYPE_NAMES = {
+    1: "Case Number", 2: "Complainant", 3: "Respondent",
+    4: "Complainant Advocate", 5: "Respondent Advocate",
+    6: "Industry Type", 7: "Judge"
+}
+
+# (CaseResponse field, Jagriti key, default when missing or null)
+CASE_FIELDS = (
+    ("case_number", "caseNumber", ""),
+    ("case_stage", "caseStageName", ""),
+    ("filing_date", "caseFilingDate", ""),
+    ("complainant", "complainantName", ""),
+    ("complainant_advocate", "complainantAdvocateName", None),
+    ("respondent", "respondentName", None),
+    ("respondent_advocate", "respondentAdvocateName", None),
+    ("document_link", "documentBase64", None),  # base64 encoded
+)
+
+
+@lru_cache(maxsize=1)
+def _year_date_range(year: int) -> tuple[str, str]:
+    """First and last day of a year as YYYY-MM-DD strings (rebuilt only when the year rolls over)"""
+    return f"{year}-01-01", f"{year}-12-31"
 
 
 class CaseService:
     """Service to handle case search operations"""
     
     def __init__(self):
-        self.settings = get_settings()
         self.logger = logging.getLogger("app.case_service")
     
     def _format_case_data(self, raw_case: Dict[str, Any]) -> CaseResponse:
-        """Format raw case data from Jagriti API to our response model"""
-        try:
-            return CaseResponse(
-                case_number=raw_case.get("caseNumber", ""),
-                case_stage=raw_case.get("caseStageName", ""),
-                filing_date=raw_case.get("caseFilingDate", ""),
-                complainant=raw_case.get("complainantName", ""),
-                complainant_advocate=raw_case.get("complainantAdvocateName"),
-                respondent=raw_case.get("respondentName"),
-                respondent_advocate=raw_case.get("respondentAdvocateName"),
-                document_link=raw_case.get("documentBase64")  # base64 encoded
-            )
-        except Exception as e:
-            raise CaseDataException(f"Error formatting case data: {str(e)}")
+        """Format raw case data from Jagriti API to our response model (no validation)"""
+        return CaseResponse.model_construct(**{
+            field: value if (value := raw_case.get(api_key)) is not None else default
+            for field, api_key, default in CASE_FIELDS
+        })
+    
+    async def _gather_lookups(self, *lookups):
+        """Run independent lookups concurrently; raise the first failure once all have settled"""
+        results = await asyncio.gather(*lookups, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+    
+    async def _gather_partial(
+        self, lookups: Dict[str, Awaitable[Any]]
+    ) -> Tuple[Dict[str, Any], Dict[str, JagritiAPIException]]:
+        """Run named lookups concurrently, splitting them into results and API failures (others raise)"""
+        results = await asyncio.gather(*lookups.values(), return_exceptions=True)
+        resolved, failures = {}, {}
+        for name, result in zip(lookups, results):
+            if isinstance(result, JagritiAPIException):
+                failures[name] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                resolved[name] = result
+        return resolved, failures
     
     def _get_default_date_range(self) -> tuple[str, str]:
         """Get default date range (current year)"""
-        current_year = datetime.now().year
-        from_date = f"{current_year}-01-01"
-        to_date = f"{current_year}-12-31"
-        return from_date, to_date
+        return _year_date_range(datetime.now().year)
     
     async def _search_cases_by_type(
         self,
@@ -50,8 +96,10 @@ class CaseService:
         to_date: Optional[str] = None,
         page: int = 0,
         size: int = 30,
-        judge_id: str = ""
-    ) -> List[CaseResponse]:
+        judge_id: str = "",
+        cursor: Optional[str] = None,
+        commission_id: Optional[int] = None
+    ) -> PaginatedCaseResponse:
         """
         Generic method to search cases by different types.
         
@@ -67,7 +115,7 @@ class CaseService:
            - Fuzzy match user's commission input (e.g., "Mumbai Suburban" matches "Mumbai (Suburban)")
            - Return ONLY the matched commission ID
         4. Call Jagriti API ONCE with the specific commission ID and search_value
-        5. Format and return results to user
+        5. Format and return results to user, with a cursor for the next page
         
         Args:
             state_name: State name entered by user
@@ -79,38 +127,41 @@ class CaseService:
             page: Page number for pagination
             size: Page size
             judge_id: Judge ID (for judge search)
+            cursor: next_cursor from a previous page; overrides page and size
+            commission_id: Already resolved commission ID (skips steps 2 and 3)
         
         Returns:
-            List of formatted case responses
+            Page of formatted case responses. next_cursor is set when the page came back full.
         """
         
-        search_type_names = {
-            1: "Case Number", 2: "Complainant", 3: "Respondent", 
-            4: "Complainant Advocate", 5: "Respondent Advocate", 
-            6: "Industry Type", 7: "Judge"
-        }
-        search_type_name = search_type_names.get(search_type, f"Type {search_type}")
+        # Jagriti only paginates by offset, so a cursor just carries the next page position
+        if cursor:
+            page, size = decode_cursor(cursor, settings.MAX_PAGE_SIZE)
+            # Cursors are not signed, so the decoded size is held to the same rule as request.size
+            if size > settings.DEFAULT_PAGE_SIZE and (not from_date or not to_date):
+                raise PageSizeException(size, settings.DEFAULT_PAGE_SIZE)
         
-        self.logger.info(f"🔍 CASE SEARCH STARTED: {search_type_name} = '{search_value}' in {state_name}/{commission_name}")
+        if self.logger.isEnabledFor(logging.INFO):
+            search_type_name = SEARCH_TYPE_NAMES.get(search_type, f"Type {search_type}")
+            self.logger.info("🔍 CASE SEARCH STARTED: %s = '%s' in %s/%s", search_type_name, search_value, state_name, commission_name)
         
         # STEP 1, 2 & 3: Resolve state and commission names to specific commission ID
-        commission_id = await mapper_service.find_commission_by_name(
-            state_name, commission_name
-        )
-        
-        self.logger.info(f"🎯 Commission resolved: '{commission_name}' -> ID {commission_id}")
+        if commission_id is None:
+            commission_id = await mapper_service.find_commission_by_name(
+                state_name, commission_name
+            )
+            
+            self.logger.info("🎯 Commission resolved: '%s' -> ID %s", commission_name, commission_id)
         
         # Use default date range if not provided
         if not from_date or not to_date:
             from_date, to_date = self._get_default_date_range()
-            self.logger.debug(f"📅 Using default date range: {from_date} to {to_date}")
+            self.logger.debug("📅 Using default date range: %s to %s", from_date, to_date)
         else:
-            self.logger.debug(f"📅 Using provided date range: {from_date} to {to_date}")
-        
-        # STEP 4: Call Jagriti API ONCE with the specific commission ID
-        self.logger.info(f"🔍 Calling Jagriti API for commission {commission_id}")
+            self.logger.debug("📅 Using provided date range: %s to %s", from_date, to_date)
         
-        response = await jagriti_client.search_cases(
+        # STEP 4: Call Jagriti API ONCE with the specific commission ID (or reuse a recent result)
+        cases_data = await self._fetch_cases(
             commission_id=commission_id,
             search_type=search_type,
             search_value=search_value,
@@ -121,100 +172,74 @@ class CaseService:
             judge_id=judge_id
         )
         
-        # Extract cases from response
-        data = response.get("data", [])
-        cases_data = data if isinstance(data, list) else data.get("content", [])
-        
-        self.logger.info(f"📋 Found {len(cases_data)} cases from commission {commission_id}")
+        # STEP 5: Format each case (upstream rows are trusted, so validation is skipped)
+        format_case = self._format_case_data
+        try:
+            all_cases = [format_case(raw_case) for raw_case in cases_data]
+        except (AttributeError, TypeError) as e:
+            raise CaseDataException(f"Error formatting case data: {str(e)}")
         
-        # STEP 5: Format each case and add to results
-        all_cases = []
-        formatted_count = 0
-        for raw_case in cases_data:
-            try:
-                formatted_case = self._format_case_data(raw_case)
-                all_cases.append(formatted_case)
-                formatted_count += 1
-            except Exception as e:
-                # Log error but continue processing other cases
-                self.logger.warning(f"⚠️ Error formatting case: {e}")
-                continue
+        self.logger.info("🎉 SEARCH COMPLETE: Successfully formatted %d cases", len(all_cases))
         
-        self.logger.info(f"🎉 SEARCH COMPLETE: Successfully formatted {formatted_count}/{len(cases_data)} cases")
-        return all_cases
+        # A full page means there may be more results upstream
+        next_cursor = encode_cursor(page + 1, size) if len(cases_data) >= size else None
+        return PaginatedCaseResponse(items=all_cases, next_cursor=next_cursor)
     
-    async def search_by_case_number(self, request: CaseSearchRequest) -> List[CaseResponse]:
-        """Search cases by case number (search_type = 1)"""
-        return await self._search_cases_by_type(
-            state_name=request.state,
-            commission_name=request.commission,
-            search_value=request.search_value,
-            search_type=1,
-            from_date=request.from_date,
-            to_date=request.to_date,
-            page=request.page,
-            size=request.size
-        )
-    
-    async def search_by_complainant(self, request: CaseSearchRequest) -> List[CaseResponse]:
-        """Search cases by complainant name (search_type = 2)"""
-        return await self._search_cases_by_type(
-            state_name=request.state,
-            commission_name=request.commission,
-            search_value=request.search_value,
-            search_type=2,
-            from_date=request.from_date,
-            to_date=request.to_date,
-            page=request.page,
-            size=request.size
-        )
-    
-    async def search_by_respondent(self, request: CaseSearchRequest) -> List[CaseResponse]:
-        """Search cases by respondent name (search_type = 3)"""
-        return await self._search_cases_by_type(
-            state_name=request.state,
-            commission_name=request.commission,
-            search_value=request.search_value,
-            search_type=3,
-            from_date=request.from_date,
-            to_date=request.to_date,
-            page=request.page,
-            size=request.size
-        )
+    async def _fetch_cases(self, **params) -> List[Dict[str, Any]]:
+        """
+        Get raw case rows for a search, served from the case results cache when possible.
+        
+        Concurrent identical searches share one upstream call: the first caller
+        fetches under a per-query lock while the others wait and then hit the cache.
+        """
+        cases_data = cache.get_cases(**params)
+        if cases_data is not None:
+            return cases_data
+        
+        async with cache.cases_lock(**params):
+            cases_data = cache.get_cases(**params)
+            if cases_data is None:
+                self.logger.info("🔍 Calling Jagriti API for commission %s", params["commission_id"])
+                response = await jagriti_client.search_cases(**params)
+                
+                cases_data = response["data"]
+                
+                self.logger.info("📋 Found %d cases from commission %s", len(cases_data), params["commission_id"])
+                cache.set_cases(cases_data, **params)
+        return cases_data
     
-    async def search_by_complainant_advocate(self, request: CaseSearchRequest) -> List[CaseResponse]:
-        """Search cases by complainant advocate (search_type = 4)"""
+    async def _search_by_value(self, request: CaseSearchRequest, search_type: int) -> PaginatedCaseResponse:
+        """Search cases by the request's search_value using the given search type"""
         return await self._search_cases_by_type(
             state_name=request.state,
             commission_name=request.commission,
             search_value=request.search_value,
-            search_type=4,
+            search_type=search_type,
             from_date=request.from_date,
             to_date=request.to_date,
             page=request.page,
-            size=request.size
+            size=request.size,
+            cursor=request.cursor
         )
     
-    async def search_by_respondent_advocate(self, request: CaseSearchRequest) -> List[CaseResponse]:
-        """Search cases by respondent advocate (search_type = 5)"""
-        return await self._search_cases_by_type(
-            state_name=request.state,
-            commission_name=request.commission,
-            search_value=request.search_value,
-            search_type=5,
-            from_date=request.from_date,
-            to_date=request.to_date,
-            page=request.page,
-            size=request.size
-        )
+    # Plain value searches only differ in the search type
+    search_by_case_number = partialmethod(_search_by_value, search_type=1)
+    search_by_complainant = partialmethod(_search_by_value, search_type=2)
+    search_by_respondent = partialmethod(_search_by_value, search_type=3)
+    search_by_complainant_advocate = partialmethod(_search_by_value, search_type=4)
+    search_by_respondent_advocate = partialmethod(_search_by_value, search_type=5)
     
-    async def search_by_industry_type(self, request: IndustryTypeSearchRequest) -> List[CaseResponse]:
+    async def search_by_industry_type(self, request: IndustryTypeSearchRequest) -> PaginatedCaseResponse:
         """Search cases by industry type/category (search_type = 6)"""
-        # Resolve category name to ID if needed
+        # Resolve category name to ID if needed, in parallel with the commission lookup
         search_value = request.category_id or request.category_name
+        commission_id = None
         if request.category_name and not request.category_id:
-            category = await mapper_service.find_category_by_name(request.category_name)
-            search_value = str(category["category_id"])
+            commission_id, category = await self._gather_lookups(
+                mapper_service.find_commission_by_name(request.state, request.commission),
+                mapper_service.find_category_by_name(request.category_name)
+            )
+            search_value = str(category.category_id)
         
         return await self._search_cases_by_type(
             state_name=request.state,
@@ -224,13 +249,17 @@ class CaseService:
             from_date=request.from_date,
             to_date=request.to_date,
             page=request.page,
-            size=request.size
+            size=request.size,
+            cursor=request.cursor,
+            commission_id=commission_id
         )
     
-    async def search_by_judge(self, request: JudgeSearchRequest) -> List[CaseResponse]:
+    async def search_by_judge(self, request: JudgeSearchRequest) -> PaginatedCaseResponse:
         """Search cases by judge (search_type = 7)"""
-        # Resolve judge name to ID if needed
+        # Resolve judge name to ID if needed (the judge lookup needs the commission ID,
+        # which is then reused for the search)
         judge_id = request.judge_id
+        commission_id = None
         if request.judge_name and not request.judge_id:
             # First get the commission ID to search judges
             commission_id = await mapper_service.find_commission_by_name(
@@ -240,7 +269,7 @@ class CaseService:
             judge = await mapper_service.find_judge_by_name(
                 commission_id, request.judge_name
             )
-            judge_id = judge["judge_id"]
+            judge_id = judge.judge_id
         
         return await self._search_cases_by_type(
             state_name=request.state,
@@ -251,8 +280,97 @@ class CaseService:
             to_date=request.to_date,
             page=request.page,
             size=request.size,
-            judge_id=str(judge_id)
+            judge_id=str(judge_id),
+            cursor=request.cursor,
+            commission_id=commission_id
+        )
+    
+    async def search_with_context(self, request: ContextSearchRequest) -> CaseSearchContextResponse:
+        """
+        Resolve the lookup context and search cases in a single call.
+        
+        Replaces the client-side /states -> /commissions -> /judges -> /cases chain.
+        Independent lookups (state, commission and, for industry searches, category)
+        run concurrently; the judge lookup needs the commission ID and runs after it.
+        
+        Lookups that fail are reported in errors next to the ones that resolved, and
+        the case search is skipped. Only an unknown state fails the whole call.
+        """
+        search_type = SEARCH_TYPES[request.search_by]
+        
+        lookups = {
+            "state": mapper_service.find_state_by_name(request.state),
+            "commission": mapper_service.resolve_commission(request.state, request.commission)
+        }
+        if search_type == 6 and request.category_id is None:
+            lookups["category"] = mapper_service.find_category_by_name(request.category_name)
+        
+        resolved, failures = await self._gather_partial(lookups)
+        
+        # Nothing about the location is known without the state
+        if "state" in failures:
+            raise failures["state"]
+        
+        state = resolved["state"]
+        commission = resolved["commission"][1] if "commission" in resolved else None
+        category = resolved.get("category")
+        
+        judge = None
+        judge_id = ""
+        if search_type == 7:
+            if request.judge_id is not None:
+                judge_id = str(request.judge_id)
+            elif commission is not None:
+                try:
+                    judge = await mapper_service.find_judge_by_name(
+                        commission.commission_id, request.judge_name
+                    )
+                    judge_id = str(judge.judge_id)
+                except JagritiAPIException as e:
+                    failures["judge"] = e
+        
+        errors = [
+            LookupErrorResponse(lookup=name, message=e.message, status_code=e.status_code)
+            for name, e in failures.items()
+        ]
+        if errors:
+            self.logger.warning("⚠️ Context search skipped: %s", "; ".join(error.message for error in errors))
+            return CaseSearchContextResponse(
+                state=state,
+                commission=commission,
+                category=category,
+                judge=judge,
+                items=[],
+                errors=errors
+            )
+        
+        search_value = (request.search_value or "").strip()
+        if search_type == 6:
+            search_value = str(category.category_id if category else request.category_id)
+        elif search_type == 7:
+            search_value = ""  # Empty for judge search
+        
+        result_page = await self._search_cases_by_type(
+            state_name=request.state,
+            commission_name=request.commission,
+            search_value=search_value,
+            search_type=search_type,
+            from_date=request.from_date,
+            to_date=request.to_date,
+            page=request.page,
+            size=request.size,
+            judge_id=judge_id,
+            cursor=request.cursor,
+            commission_id=commission.commission_id
+        )
+        
+        return CaseSearchContextResponse(
+            state=state,
+            commission=commission,
+            category=category,
+            judge=judge,
+            items=result_page.items,
+            next_cursor=result_page.next_cursor
         )
-
 
 case_service = CaseService()
\ No newline at end of file
@@ -1,26 +1,57 @@
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import orjson
 from typing import Optional, Dict, Any
+import asyncio
 import logging
+import socket
 import time
-from app.config import get_settings
+from app.config import settings
 from app.utils.exceptions import APITimeoutException, APIConnectionException, JagritiAPIException
 
 
+# Failed connects are retried with exponential backoff (2s, 4s, ... capped); each attempt waits at most
+# CONNECT_TIMEOUT. Read/write timeouts are not retried (the search may already have run upstream), nor
+# are pool timeouts (every pooled connection is busy, so another attempt only adds load).
+RETRY_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout)
+RETRY_ATTEMPTS = 3
+RETRY_MAX_WAIT = 10
+
+# Case search payload with defaults; copied and filled in per call (key order is what Jagriti expects)
+SEARCH_PAYLOAD_TEMPLATE = {
+    "commissionId": None,
+    "page": 0,
+    "size": 30,
+    "fromDate": None,
+    "toDate": None,
+    "dateRequestType": 1,
+    "serchType": None,
+    "serchTypeValue": "",
+    "judgeId": ""
+}
+
+# Search types that filter on dateRequestType=2
+DATE_REQUEST_TYPE_2 = frozenset({6, 7})
+
+
 class JagritiClient:
     """HTTP client for Jagriti API with retry logic"""
     
     def __init__(self):
-        self.settings = get_settings()
-        self.base_url = self.settings.JAGRITI_BASE_URL
-        self.timeout = self.settings.REQUEST_TIMEOUT
+        self.base_url = settings.JAGRITI_BASE_URL
+        # Short connect/pool waits so retried connects stay cheap; reads may take the full REQUEST_TIMEOUT
+        self.timeout = httpx.Timeout(
+            settings.REQUEST_TIMEOUT,
+            connect=settings.CONNECT_TIMEOUT,
+            pool=settings.CONNECT_TIMEOUT
+        )
         self.logger = logging.getLogger("app.jagriti_client")
         
-        # Common headers for all requests
+        # Common headers for all requests (no Connection header: it is invalid over HTTP/2,
+        # and the shared pool keeps connections alive anyway)
         self.headers = {
             "Accept": "application/json",
+            "Accept-Encoding": "br, gzip",  # br is decoded by httpx via the brotli package
             "Accept-Language": "en-US,en;q=0.5",
-            "Connection": "keep-alive",
             "Content-Type": "application/json",
             "Origin": self.base_url,
             "Referer": f"{self.base_url}/",
@@ -30,13 +61,72 @@ class JagritiClient:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
         
-        self.logger.info(f"🌐 Jagriti client initialized - Base URL: {self.base_url}, Timeout: {self.timeout}s")
+        # Shared connection pool, opened by start() (app lifespan) or lazily on first request
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        self.logger.info(
+            f"🌐 Jagriti client initialized - Base URL: {self.base_url}, Timeout: {settings.REQUEST_TIMEOUT}s "
+            f"(connect/pool: {settings.CONNECT_TIMEOUT}s)"
+        )
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 client, creating it on first use"""
+        if self._client is None:
+            max_connections = settings.MAX_CONCURRENT_REQUESTS
+            # The transport retries failed connects once right away, before the backoff in _send;
+            # TCP keepalive stops idle pooled connections from being dropped by middleboxes
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=1,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections
+                ),
+                socket_options=[(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            )
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=self.timeout,
+                transport=transport
+            )
+            self.logger.info(f"🔗 HTTP/2 connection pool opened - Max connections: {max_connections}")
+        return self._client
+    
+    async def start(self):
+        """Open the shared connection pool"""
+        self._get_client()
+    
+    async def aclose(self):
+        """Close the shared connection pool"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self.logger.info("🔌 HTTP connection pool closed")
+    
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict],
+        json_data: Optional[Dict]
+    ) -> httpx.Response:
+        """Send a request, retrying failures to connect"""
+        client = self._get_client()
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            try:
+                # base_url and headers are set once on the shared client
+                return await client.request(method, endpoint, params=params, json=json_data)
+            except RETRY_EXCEPTIONS as e:
+                if attempt == RETRY_ATTEMPTS:
+                    raise
+                delay = min(2 ** attempt, RETRY_MAX_WAIT)
+                self.logger.warning(
+                    "🔁 API RETRY: %s %s - %s, retrying in %ds (attempt %d/%d)",
+                    method, endpoint, type(e).__name__, delay, attempt + 1, RETRY_ATTEMPTS
+                )
+                await asyncio.sleep(delay)
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.ConnectError))
-    )
     async def _make_request(
         self,
         method: str,
@@ -45,57 +135,53 @@ class JagritiClient:
         json_data: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """Make HTTP request with retry logic"""
-        url = f"{self.base_url}{endpoint}"
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Log request details
         if params and json_data:
-            self.logger.info(f"🌐 API CALL: {method} {endpoint} - Params: {params} - Data: {json_data}")
+            self.logger.info("🌐 API CALL: %s %s - Params: %s - Data: %s", method, endpoint, params, json_data)
         elif params:
-            self.logger.info(f"🌐 API CALL: {method} {endpoint} - Params: {params}")
+            self.logger.info("🌐 API CALL: %s %s - Params: %s", method, endpoint, params)
         elif json_data:
             # Log all data including serchTypeValue
-            self.logger.info(f"🌐 API CALL: {method} {endpoint} - Data: {json_data}")
+            self.logger.info("🌐 API CALL: %s %s - Data: %s", method, endpoint, json_data)
         else:
-            self.logger.info(f"🌐 API CALL: {method} {endpoint}")
+            self.logger.info("🌐 API CALL: %s %s", method, endpoint)
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                if method.upper() == "GET":
-                    response = await client.get(url, params=params, headers=self.headers)
-                elif method.upper() == "POST":
-                    response = await client.post(url, params=params, json=json_data, headers=self.headers)
-                else:
-                    raise ValueError(f"Unsupported method: {method}")
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                # Log successful response
-                elapsed = time.time() - start_time
-                data_count = len(result.get('data', [])) if isinstance(result.get('data'), list) else 'N/A'
-                self.logger.info(f"✅ API SUCCESS: {method} {endpoint} - Status: {response.status_code} - Time: {elapsed:.3f}s - Items: {data_count}")
-                
-                return result
-                
+            response = await self._send(method, endpoint, params, json_data)
+            
+            response.raise_for_status()
+            # Parse straight from the raw bytes; orjson skips the intermediate str decode
+            result = orjson.loads(response.content)
+            
+            # Log successful response (skip the item count entirely when INFO is off)
+            if self.logger.isEnabledFor(logging.INFO):
+                elapsed = time.perf_counter() - start_time
+                data = result.get('data')
+                data_count = len(data) if isinstance(data, list) else 'N/A'
+                self.logger.info("✅ API SUCCESS: %s %s - Status: %s - Time: %.3fs - Items: %s", method, endpoint, response.status_code, elapsed, data_count)
+            
+            return result
+            
         except httpx.TimeoutException:
-            elapsed = time.time() - start_time
-            self.logger.error(f"⏰ API TIMEOUT: {method} {endpoint} - Time: {elapsed:.3f}s")
+            elapsed = time.perf_counter() - start_time
+            self.logger.error("⏰ API TIMEOUT: %s %s - Time: %.3fs", method, endpoint, elapsed)
             raise APITimeoutException()
         except httpx.ConnectError:
-            elapsed = time.time() - start_time
-            self.logger.error(f"🔌 API CONNECTION ERROR: {method} {endpoint} - Time: {elapsed:.3f}s")
+            elapsed = time.perf_counter() - start_time
+            self.logger.error("🔌 API CONNECTION ERROR: %s %s - Time: %.3fs", method, endpoint, elapsed)
             raise APIConnectionException()
         except httpx.HTTPStatusError as e:
-            elapsed = time.time() - start_time
-            self.logger.error(f"🚨 API HTTP ERROR: {method} {endpoint} - Status: {e.response.status_code} - Time: {elapsed:.3f}s")
+            elapsed = time.perf_counter() - start_time
+            self.logger.error("🚨 API HTTP ERROR: %s %s - Status: %s - Time: %.3fs", method, endpoint, e.response.status_code, elapsed)
             raise JagritiAPIException(
                 message=f"API returned error: {e.response.status_code}",
                 status_code=e.response.status_code
             )
         except Exception as e:
-            elapsed = time.time() - start_time
-            self.logger.error(f"💥 API UNEXPECTED ERROR: {method} {endpoint} - Error: {str(e)} - Time: {elapsed:.3f}s")
+            elapsed = time.perf_counter() - start_time
+            self.logger.error("💥 API UNEXPECTED ERROR: %s %s - Error: %s - Time: %.3fs", method, endpoint, e, elapsed)
             raise JagritiAPIException(
                 message=f"Unexpected error: {str(e)}",
                 status_code=500
@@ -156,27 +242,36 @@ class JagritiClient:
             page: Page number
             size: Page size
             judge_id: Judge ID (only for judge search)
+        
+        Returns:
+            Response body whose "data" is always the list of case rows
         """
+        payload = SEARCH_PAYLOAD_TEMPLATE.copy()
+        payload.update(
+            commissionId=commission_id,
+            page=page,
+            size=size,
+            fromDate=from_date,
+            toDate=to_date,
+            serchType=search_type,
+            serchTypeValue=search_value,
+            judgeId=judge_id
+        )
         # For industry (6) and judge (7), use dateRequestType=2, others use 1
-        date_request_type = 2 if search_type in [6, 7] else 1
-        
-        payload = {
-            "commissionId": commission_id,
-            "page": page,
-            "size": size,
-            "fromDate": from_date,
-            "toDate": to_date,
-            "dateRequestType": date_request_type,
-            "serchType": search_type,
-            "serchTypeValue": search_value,
-            "judgeId": judge_id
-        }
+        if search_type in DATE_REQUEST_TYPE_2:
+            payload["dateRequestType"] = 2
         
-        return await self._make_request(
+        result = await self._make_request(
             method="POST",
             endpoint="/services/case/caseFilingService/v2/getCaseDetailsBySearchType",
             json_data=payload
         )
+        
+        # Jagriti returns either a bare list or a page object; hand callers a plain list
+        data = result.get("data")
+        if not isinstance(data, list):
+            result["data"] = data.get("content", []) if isinstance(data, dict) else []
+        return result
 
 
 jagriti_client = JagritiClient()
\ No newline at end of file
@@ -1,9 +1,15 @@
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Hashable, Callable, Awaitable, Iterator
+from bisect import bisect_right
+from functools import lru_cache
 import logging
 import asyncio
+import sys
+import orjson
+from cachetools import LRUCache
 from app.services.jagriti_client import jagriti_client
 from app.services.cache_service import cache
-from app.config import get_settings
+from app.models.responses import StateResponse, CategoryResponse
+from app.models.records import CommissionRecord, CategoryRecord, JudgeRecord, LookupRecord
 from app.utils.exceptions import (
     StateNotFoundException,
     CommissionNotFoundException,
@@ -12,129 +18,252 @@ from app.utils.exceptions import (
 )
 
 
+logger = logging.getLogger("app.mapper")
+
+# Characters dropped by normalize_text, removed in a single translate pass
+NORMALIZE_TABLE = str.maketrans("", "", "() ")
+
+
+@lru_cache(maxsize=2048)
+def normalize_text(text: str) -> str:
+    """Normalize text for comparison - removes spaces, parentheses, and converts to uppercase (memoized)"""
+    return text.strip().upper().translate(NORMALIZE_TABLE)
+
+
+class NameIndex:
+    """Name lookups over one cached record list, matched on the records' normalized names"""
+    
+    __slots__ = ("records", "exact", "haystack", "starts", "max_len")
+    
+    def __init__(self, records: List[LookupRecord]):
+        self.records = records
+        self.exact: Dict[str, LookupRecord] = {}
+        self.starts: List[int] = []
+        self.max_len = 0
+        offset = 0
+        for item in records:
+            name_norm = item.name_norm
+            self.exact.setdefault(name_norm, item)
+            self.starts.append(offset)
+            offset += len(name_norm) + 1
+            self.max_len = max(self.max_len, len(name_norm))
+        # All names joined by NUL, so a substring search over every record is one str.find
+        self.haystack = "\x00".join(item.name_norm for item in records)
+    
+    def substring_matches(self, search_norm: str) -> Iterator[LookupRecord]:
+        """Yield, in list order, every record whose normalized name contains search_norm"""
+        # A query longer than every name cannot be a substring of any of them
+        if not self.records or len(search_norm) > self.max_len or "\x00" in search_norm:
+            return
+        pos = self.haystack.find(search_norm)
+        while pos != -1:
+            i = bisect_right(self.starts, pos) - 1
+            yield self.records[i]
+            if i + 1 == len(self.records):
+                return
+            pos = self.haystack.find(search_norm, self.starts[i + 1])
+    
+    def find(self, search_norm: str) -> Optional[LookupRecord]:
+        """Exact normalized name match first, otherwise the first record containing search_norm"""
+        item = self.exact.get(search_norm)
+        if item is None:
+            item = next(self.substring_matches(search_norm), None)
+        return item
+
+
 class MapperService:
     """Service to map text inputs to Jagriti API IDs"""
     
     def __init__(self):
-        self.settings = get_settings()
-        self.logger = logging.getLogger("app.mapper")
+        # Background refreshes by cache key, registered when scheduled so a burst of stale hits
+        # starts only one (also keeps strong references, asyncio only keeps weak ones)
+        self._refresh_tasks: Dict[Hashable, asyncio.Task] = {}
+        # Normalized state input -> state ID it last resolved to, used to prefetch commissions
+        self._state_ids: LRUCache = LRUCache(maxsize=256)
+        # Name indexes by logical cache key, rebuilt whenever the cache hands back a different list
+        # (bounded like the caches behind them, so evicted lists are not kept alive)
+        self._name_indexes: LRUCache = LRUCache(maxsize=256)
     
-    def _normalize_text(self, text: str) -> str:
-        """Normalize text for comparison - removes spaces, parentheses, and converts to uppercase"""
-        normalized = text.strip().upper()
-        normalized = normalized.replace("(", "").replace(")", "").replace(" ", "")
-        return normalized
+    def _name_index(self, key: Hashable, records: List[LookupRecord]) -> NameIndex:
+        """
+        Get the name index for a cached record list (case-insensitive, flexible matching that
+        ignores parentheses and spaces, via the records' pre-normalized names)
+        """
+        index = self._name_indexes.get(key)
+        if index is None or index.records is not records:
+            index = self._name_indexes[key] = NameIndex(records)
+        return index
     
-    def _fuzzy_match(self, search_text: str, target_text: str) -> bool:
-        """Check if texts match (case-insensitive, flexible, ignores parentheses and spaces)"""
-        search = self._normalize_text(search_text)
-        target = self._normalize_text(target_text)
-        
-        if search == target:
-            return True
-        
-        if search in target:
-            return True
-        
-        return False
+    def _schedule_refresh(self, key: Hashable, refresh: Callable[..., Awaitable[Any]], *args):
+        """Refresh a stale cache entry in the background unless a refresh is already running"""
+        if key in self._refresh_tasks or cache.is_refreshing(key):
+            return
+        task = self._refresh_tasks[key] = asyncio.create_task(self._background_refresh(key, refresh, *args))
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+    
+    async def _background_refresh(self, key: Hashable, refresh: Callable[..., Awaitable[Any]], *args):
+        """Run a refresh, keeping the stale data if the upstream call fails"""
+        try:
+            await refresh(*args)
+        except Exception as e:
+            logger.warning("⚠️ Background refresh of %s failed, keeping stale data: %s", key, e)
     
-    async def get_all_states(self) -> List[Dict[str, Any]]:
-        """Get all states with caching"""
-        self.logger.debug("🗺️ Requesting all states...")
+    async def get_all_states(self) -> List[CommissionRecord]:
+        """Get all states with caching (stale entries are served while refreshing in background)"""
+        logger.debug("🗺️ Requesting all states...")
         
         # Check cache first (cache stores formatted data)
-        if cache.is_states_valid(self.settings.CACHE_TTL_STATES):
+        cached_data = cache.get_states()
+        if cached_data:
+            if cache.is_stale("states"):
+                logger.debug("♻️ States cache is stale - serving cached data and refreshing in background")
+                self._schedule_refresh("states", self._refresh_states)
+            else:
+                logger.debug("📋 Returning %d states from cache", len(cached_data))
+            return cached_data
+        
+        return await self._refresh_states()
+    
+    async def _refresh_states(self) -> List[CommissionRecord]:
+        """Fetch states from Jagriti API and cache them (single flight)"""
+        async with cache.refresh_lock("states"):
+            # Another request may have refreshed the cache while we waited
             cached_data = cache.get_states()
-            if cached_data:
-                self.logger.debug(f"📋 Returning {len(cached_data)} states from cache")
+            if cached_data and not cache.is_stale("states"):
                 return cached_data
-        
-        # Cache miss/expired - Fetch from API
-        self.logger.info("🌐 Cache miss/expired - Fetching states from Jagriti API")
-        response = await jagriti_client.get_states()
-        states_data = response.get("data", [])
-        
-        # Filter only District Consumer Courts (DCDRC)
-        filtered_states = [
-            {
-                "commission_id": s["commissionId"],
-                "commission_name": s["commissionNameEn"],
-                "is_circuit_bench": s["circuitAdditionBenchStatus"],
-                "is_active": s["activeStatus"]
-            }
-            for s in states_data
-            # if s["activeStatus"] and not s["circuitAdditionBenchStatus"]
-            if s["activeStatus"] 
-        ]
-        
-        self.logger.info(f"📋 Filtered {len(filtered_states)} active DCDRC states from {len(states_data)} total")
-        
-        # Cache the formatted result
-        cache.set_states(filtered_states)
-        
-        return filtered_states
+            
+            # Cache miss/expired - Fetch from API
+            logger.info("🌐 Cache miss/expired - Fetching states from Jagriti API")
+            response = await jagriti_client.get_states()
+            states_data = response.get("data", [])
+            
+            # Filter only District Consumer Courts (DCDRC). Record names are interned (here and in
+            # the other lists) so names repeated across cached lists share one string; user input is not
+            filtered_states = [
+                CommissionRecord(
+                    commission_id=s["commissionId"],
+                    commission_name=sys.intern(s["commissionNameEn"]),
+                    is_circuit_bench=s["circuitAdditionBenchStatus"],
+                    is_active=s["activeStatus"],
+                    name_norm=sys.intern(normalize_text(s["commissionNameEn"]))
+                )
+                for s in states_data
+                # if s["activeStatus"] and not s["circuitAdditionBenchStatus"]
+                if s["activeStatus"] 
+            ]
+            
+            logger.info(f"📋 Filtered {len(filtered_states)} active DCDRC states from {len(states_data)} total")
+            
+            # Cache the formatted result
+            cache.set_states(filtered_states)
+            
+            return filtered_states
     
-    async def find_state_by_name(self, state_name: str) -> Dict[str, Any]:
+    async def get_states_json(self) -> bytes:
+        """Get all states as a JSON array, serialized once per cache refresh"""
+        states = await self.get_all_states()
+        body = cache.get_states_response()
+        if body is None:
+            body = orjson.dumps([StateResponse.model_validate(s).model_dump() for s in states])
+            cache.set_states_response(body)
+        return body
+    
+    async def find_state_by_name(self, state_name: str) -> CommissionRecord:
         """Find state by name"""
-        self.logger.debug(f"🔍 Searching for state: '{state_name}'")
+        logger.debug("🔍 Searching for state: '%s'", state_name)
         states = await self.get_all_states()
+        search_norm = normalize_text(state_name)
         
-        for state in states:
-            if self._fuzzy_match(state_name, state["commission_name"]):
-                self.logger.info(f"✅ State found: '{state_name}' -> ID {state['commission_id']} ({state['commission_name']})")
-                return state
+        # Exact name first, then fall back to a substring match
+        state = self._name_index("states", states).find(search_norm)
+        if state is not None:
+            logger.info(f"✅ State found: '{state_name}' -> ID {state.commission_id} ({state.commission_name})")
+            return state
         
-        self.logger.error(f"❌ State not found: '{state_name}'")
+        logger.error(f"❌ State not found: '{state_name}'")
         raise StateNotFoundException(state_name)
     
-    async def get_commissions_by_state(self, state_id: int) -> List[Dict[str, Any]]:
-        """Get all commissions/districts for a state with caching"""
-        self.logger.debug(f"🏛️ Requesting commissions for state {state_id}...")
+    async def get_commissions_by_state(self, state_id: int) -> List[CommissionRecord]:
+        """Get all commissions/districts for a state with caching (stale entries are served while refreshing)"""
+        logger.debug("🏛️ Requesting commissions for state %s...", state_id)
         
         # Check cache first (cache stores formatted data)
         cached_data = cache.get_commissions(state_id)
         if cached_data is not None:
-            self.logger.debug(f"📋 Returning {len(cached_data)} commissions from cache for state {state_id}")
+            if cache.is_stale(("commissions", state_id)):
+                logger.debug("♻️ Commissions cache for state %s is stale - refreshing in background", state_id)
+                self._schedule_refresh(("commissions", state_id), self._refresh_commissions, state_id)
+            else:
+                logger.debug("📋 Returning %d commissions from cache for state %s", len(cached_data), state_id)
             return cached_data
         
-        # Cache miss - Fetch from API
-        self.logger.info(f"🌐 Cache miss - Fetching commissions for state {state_id} from Jagriti API")
-        response = await jagriti_client.get_districts(state_id)
-        districts_data = response.get("data", [])
-        
-        # Format the districts data
-        formatted_districts = [
-            {
-                "commission_id": d["commissionId"],
-                "commission_name": d["commissionNameEn"],
-                "is_circuit_bench": d["circuitAdditionBenchStatus"],
-                "is_active": d["activeStatus"]
-            }
-            for d in districts_data
-            if d["activeStatus"]
-        ]
-        
-        self.logger.info(f"📋 Formatted {len(formatted_districts)} active commissions for state {state_id}")
-        
-        # Cache the formatted result
-        cache.set_commissions(state_id, formatted_districts)
-        
-        return formatted_districts
+        return await self._refresh_commissions(state_id)
+    
+    async def _refresh_commissions(self, state_id: int) -> List[CommissionRecord]:
+        """Fetch commissions for a state from Jagriti API and cache them (single flight)"""
+        async with cache.refresh_lock(("commissions", state_id)):
+            # Another request may have refreshed the cache while we waited
+            cached_data = cache.get_commissions(state_id)
+            if cached_data is not None and not cache.is_stale(("commissions", state_id)):
+                return cached_data
+            
+            # Cache miss - Fetch from API
+            logger.info(f"🌐 Cache miss - Fetching commissions for state {state_id} from Jagriti API")
+            response = await jagriti_client.get_districts(state_id)
+            districts_data = response.get("data", [])
+            
+            # Format the districts data
+            formatted_districts = [
+                CommissionRecord(
+                    commission_id=d["commissionId"],
+                    commission_name=sys.intern(d["commissionNameEn"]),
+                    is_circuit_bench=d["circuitAdditionBenchStatus"],
+                    is_active=d["activeStatus"],
+                    name_norm=sys.intern(normalize_text(d["commissionNameEn"]))
+                )
+                for d in districts_data
+                if d["activeStatus"]
+            ]
+            # Non-circuit benches first (stable, so upstream order is kept within each group)
+            formatted_districts.sort(key=lambda d: d.is_circuit_bench)
+            
+            logger.info(f"📋 Formatted {len(formatted_districts)} active commissions for state {state_id}")
+            
+            # Cache the formatted result
+            cache.set_commissions(state_id, formatted_districts)
+            cache.set_has_districts(state_id, bool(formatted_districts))
+            
+            return formatted_districts
+    
+    async def _get_districts_for_resolution(self, state_id: int) -> List[CommissionRecord]:
+        """Commissions of a state for name resolution, skipping the lookup for states known to have none"""
+        if cache.get_has_districts(state_id) is False:
+            return []
+        return await self.get_commissions_by_state(state_id)
     
     async def find_commission_by_name(
         self, 
         state_name: str, 
         commission_name: str
     ) -> int:
+        """Find commission by name and return the specific commission ID (see resolve_commission)"""
+        _, commission = await self.resolve_commission(state_name, commission_name)
+        return commission.commission_id
+    
+    async def resolve_commission(
+        self,
+        state_name: str,
+        commission_name: str
+    ) -> Tuple[CommissionRecord, CommissionRecord]:
         """
-        Find commission by name and return the specific commission ID.
+        Find the state and the specific commission matching the user's input.
         
         FLOW:
         1. Find state ID by name (uses cache if available, else calls API)
         2. Get all commissions for that state (uses cache if available, else calls API)
         3. Fuzzy match the commission name entered by user (ignores spaces, parentheses)
         4. Prioritize non-circuit benches over circuit benches (e.g., "Mumbai(Suburban)" over "Additional DCF, Mumbai(Suburban)")
-        5. If match found, return that specific commission ID
+        5. If match found, return the state together with that specific commission
         6. If no match, raise CommissionNotFoundException
         
         Args:
@@ -142,141 +271,174 @@ class MapperService:
             commission_name: Commission name entered by user (e.g., "Mumbai Suburban" or "Mumbai(Suburban)")
         
         Returns:
-            commission_id: The specific commission ID that matches the user's input
+            (state, commission): The resolved state and the commission that matches the user's input.
+            If the state has no districts, the state itself is returned as the commission.
         
         Raises:
             CommissionNotFoundException: If the commission name doesn't match any commission
         """
-        self.logger.debug(f"🔍 Searching for commission: '{commission_name}' in state '{state_name}'")
-        
-        # STEP 1: Find the state ID (cache-first)
-        state = await self.find_state_by_name(state_name)
-        state_id = state["commission_id"]
-        self.logger.info(f"✅ State resolved: '{state_name}' -> ID {state_id}")
-        
-        # STEP 2: Get all commissions/districts for this state (cache-first)
-        commissions = await self.get_commissions_by_state(state_id)
+        logger.debug("🔍 Searching for commission: '%s' in state '%s'", commission_name, state_name)
+        
+        # STEP 1 & 2: Find the state ID, then all commissions/districts for it (cache-first).
+        # If the states list has to be fetched and this input resolved before, fetch the
+        # commissions for the remembered state ID at the same time.
+        state_norm = normalize_text(state_name)
+        guessed_id = self._state_ids.get(state_norm)
+        if guessed_id is not None and cache.get_states() is None:
+            state, commissions = await asyncio.gather(
+                self.find_state_by_name(state_name),
+                self._get_districts_for_resolution(guessed_id)
+            )
+            state_id = state.commission_id
+            if state_id != guessed_id:
+                commissions = await self._get_districts_for_resolution(state_id)
+        else:
+            state = await self.find_state_by_name(state_name)
+            state_id = state.commission_id
+            commissions = await self._get_districts_for_resolution(state_id)
+        self._state_ids[state_norm] = state_id
+        logger.info(f"✅ State resolved: '{state_name}' -> ID {state_id}")
         
         # STEP 3: If no districts exist, the state itself is the commission
         if not commissions:
-            self.logger.info(f"📍 No districts found for state {state_id} - returning state level commission")
-            return state_id
+            logger.info(f"📍 No districts found for state {state_id} - returning state level commission")
+            return state, state
         
-        # STEP 4: Find all matching commissions with fuzzy matching
-        # Collect all matches and prioritize non-circuit benches
-        matches = []
-        for commission in commissions:
-            if self._fuzzy_match(commission_name, commission["commission_name"]):
-                is_circuit = commission.get("is_circuit_bench", False)
-                matches.append({
-                    "commission": commission,
-                    "is_circuit": is_circuit
-                })
-                self.logger.debug(f"📍 Match found: '{commission['commission_name']}' (ID: {commission['commission_id']}, Circuit: {is_circuit})")
+        # STEP 4: Fuzzy match (exact names first). Commissions are cached with non-circuit
+        # benches first, so the first substring match already has the right priority.
+        search_norm = normalize_text(commission_name)
+        selected = self._name_index(("commissions", state_id), commissions).find(search_norm)
         
-        # STEP 5: If matches found, prioritize non-circuit benches
-        if matches:
-            # Sort by circuit status (False first, meaning non-circuit benches first)
-            matches.sort(key=lambda x: x["is_circuit"])
-            
-            selected = matches[0]["commission"]
-            self.logger.info(f"✅ Commission matched: '{commission_name}' -> '{selected['commission_name']}' (ID: {selected['commission_id']})")
-            
-            # Log if we had multiple matches and chose the non-circuit one
-            if len(matches) > 1:
-                self.logger.info(f"📌 Multiple matches found ({len(matches)}), prioritized non-circuit bench: '{selected['commission_name']}'")
-            
-            return selected["commission_id"]
+        # STEP 5: If a match was found, return it
+        if selected is not None:
+            logger.info(f"✅ Commission matched: '{commission_name}' -> '{selected.commission_name}' (ID: {selected.commission_id})")
+            return state, selected
         
         # STEP 6: If no match found, raise exception
-        available_commissions = [c["commission_name"] for c in commissions]
-        self.logger.error(f"❌ Commission not found: '{commission_name}' in state '{state_name}'")
+        available_commissions = [c.commission_name for c in commissions]
+        logger.error(f"❌ Commission not found: '{commission_name}' in state '{state_name}'")
         raise CommissionNotFoundException(
-            f"Commission '{commission_name}' not found in state '{state_name}'. "
-            f"Available commissions: {', '.join(available_commissions)}"
+            commission_name,
+            f" in state '{state_name}'. Available commissions: {', '.join(available_commissions)}"
         )
     
-    async def get_all_categories(self) -> List[Dict[str, Any]]:
-        """Get all case categories with caching"""
-        self.logger.debug("📚 Requesting all categories...")
+    async def get_all_categories(self) -> List[CategoryRecord]:
+        """Get all case categories with caching (stale entries are served while refreshing in background)"""
+        logger.debug("📚 Requesting all categories...")
         
         # Check cache first (cache stores formatted data)
-        if cache.is_categories_valid(self.settings.CACHE_TTL_CATEGORIES):
+        cached_data = cache.get_categories()
+        if cached_data:
+            if cache.is_stale("categories"):
+                logger.debug("♻️ Categories cache is stale - serving cached data and refreshing in background")
+                self._schedule_refresh("categories", self._refresh_categories)
+            else:
+                logger.debug("📋 Returning %d categories from cache", len(cached_data))
+            return cached_data
+        
+        return await self._refresh_categories()
+    
+    async def _refresh_categories(self) -> List[CategoryRecord]:
+        """Fetch categories from Jagriti API and cache them (single flight)"""
+        async with cache.refresh_lock("categories"):
+            # Another request may have refreshed the cache while we waited
             cached_data = cache.get_categories()
-            if cached_data:
-                self.logger.debug(f"📋 Returning {len(cached_data)} categories from cache")
+            if cached_data and not cache.is_stale("categories"):
                 return cached_data
-        
-        # Cache miss/expired - Fetch from API
-        self.logger.info("🌐 Cache miss/expired - Fetching categories from Jagriti API")
-        response = await jagriti_client.get_categories()
-        categories_data = response.get("data", [])
-        
-        # Format the categories data
-        formatted_categories = [
-            {
-                "category_id": c["caseCategoryId"],
-                "category_name": c["caseCategoryNameEn"]
-            }
-            for c in categories_data
-        ]
-        
-        self.logger.info(f"📋 Formatted {len(formatted_categories)} categories")
-        
-        # Cache the formatted result
-        cache.set_categories(formatted_categories)
-        
-        return formatted_categories
+            
+            # Cache miss/expired - Fetch from API
+            logger.info("🌐 Cache miss/expired - Fetching categories from Jagriti API")
+            response = await jagriti_client.get_categories()
+            categories_data = response.get("data", [])
+            
+            # Format the categories data
+            formatted_categories = [
+                CategoryRecord(
+                    category_id=c["caseCategoryId"],
+                    category_name=sys.intern(c["caseCategoryNameEn"]),
+                    name_norm=sys.intern(normalize_text(c["caseCategoryNameEn"]))
+                )
+                for c in categories_data
+            ]
+            
+            logger.info(f"📋 Formatted {len(formatted_categories)} categories")
+            
+            # Cache the formatted result
+            cache.set_categories(formatted_categories)
+            
+            return formatted_categories
+    
+    async def get_categories_json(self) -> bytes:
+        """Get all categories as a JSON array, serialized once per cache refresh"""
+        categories = await self.get_all_categories()
+        body = cache.get_categories_response()
+        if body is None:
+            body = orjson.dumps([CategoryResponse.model_validate(c).model_dump() for c in categories])
+            cache.set_categories_response(body)
+        return body
     
-    async def find_category_by_name(self, category_name: str) -> Dict[str, Any]:
+    async def find_category_by_name(self, category_name: str) -> CategoryRecord:
         """Find category by name"""
         categories = await self.get_all_categories()
+        search_norm = normalize_text(category_name)
         
-        for category in categories:
-            if self._fuzzy_match(category_name, category["category_name"]):
-                return category
+        category = self._name_index("categories", categories).find(search_norm)
+        if category is not None:
+            return category
         
         raise CategoryNotFoundException(category_name)
     
-    async def get_judges_by_commission(self, commission_id: int) -> List[Dict[str, Any]]:
-        """Get all judges for a commission with caching"""
-        self.logger.debug(f"👨‍⚖️ Requesting judges for commission {commission_id}...")
+    async def get_judges_by_commission(self, commission_id: int) -> List[JudgeRecord]:
+        """Get all judges for a commission with caching (concurrent misses share one fetch)"""
+        logger.debug("👨‍⚖️ Requesting judges for commission %s...", commission_id)
         
         # Check cache first (cache stores formatted data)
         cached_data = cache.get_judges(commission_id)
         if cached_data is not None:
-            self.logger.debug(f"📋 Returning {len(cached_data)} judges from cache for commission {commission_id}")
+            logger.debug("📋 Returning %d judges from cache for commission %s", len(cached_data), commission_id)
             return cached_data
         
-        # Cache miss - Fetch from API
-        self.logger.info(f"🌐 Cache miss - Fetching judges for commission {commission_id} from Jagriti API")
-        response = await jagriti_client.get_judges(commission_id)
-        judges_data = response.get("data", [])
-        
-        # Format the judges data
-        formatted_judges = [
-            {
-                "judge_id": j["judgeId"],
-                "judge_name": j["judgeName"],
-                "commission_id": commission_id
-            }
-            for j in judges_data
-        ]
-        
-        self.logger.info(f"📋 Formatted {len(formatted_judges)} judges for commission {commission_id}")
-        
-        # Cache the formatted result
-        cache.set_judges(commission_id, formatted_judges)
-        
-        return formatted_judges
+        return await self._refresh_judges(commission_id)
+    
+    async def _refresh_judges(self, commission_id: int) -> List[JudgeRecord]:
+        """Fetch judges for a commission from Jagriti API and cache them (single flight)"""
+        async with cache.judges_lock(commission_id):
+            # Another request may have fetched them while we waited
+            cached_data = cache.get_judges(commission_id)
+            if cached_data is not None:
+                return cached_data
+            
+            # Cache miss - Fetch from API
+            logger.info(f"🌐 Cache miss - Fetching judges for commission {commission_id} from Jagriti API")
+            response = await jagriti_client.get_judges(commission_id)
+            judges_data = response.get("data", [])
+            
+            # Format the judges data
+            formatted_judges = [
+                JudgeRecord(
+                    judge_id=j["judgeId"],
+                    judge_name=sys.intern(j["judgeName"]),
+                    commission_id=commission_id,
+                    name_norm=sys.intern(normalize_text(j["judgeName"]))
+                )
+                for j in judges_data
+            ]
+            
+            logger.info(f"📋 Formatted {len(formatted_judges)} judges for commission {commission_id}")
+            
+            # Cache the formatted result
+            cache.set_judges(commission_id, formatted_judges)
+            
+            return formatted_judges
     
-    async def find_judge_by_name(self, commission_id: int, judge_name: str) -> Dict[str, Any]:
+    async def find_judge_by_name(self, commission_id: int, judge_name: str) -> JudgeRecord:
         """Find judge by name in a specific commission"""
         judges = await self.get_judges_by_commission(commission_id)
+        search_norm = normalize_text(judge_name)
         
-        for judge in judges:
-            if self._fuzzy_match(judge_name, judge["judge_name"]):
-                return judge
+        judge = self._name_index(("judges", commission_id), judges).find(search_norm)
+        if judge is not None:
+            return judge
         
         raise JudgeNotFoundException(judge_name)
 
@@ -24,36 +24,29 @@ class APIConnectionException(JagritiAPIException):
         super().__init__(message, 503)
 
 
-class StateNotFoundException(JagritiAPIException):
-    """Raised when requested state is not found"""
+class NotFoundException(JagritiAPIException):
+    """Raised when a requested state, commission, category or judge is not found"""
     
-    def __init__(self, state_name: str):
-        message = f"State '{state_name}' not found"
-        super().__init__(message, 404)
-
-
-class CommissionNotFoundException(JagritiAPIException):
-    """Raised when requested commission is not found"""
+    kind = "Item"
     
-    def __init__(self, commission_name: str):
-        message = f"Commission '{commission_name}' not found"
+    def __init__(self, name: str, detail: str = ""):
+        self.name = name
+        message = f"{self.kind} '{name}' not found{detail}"
         super().__init__(message, 404)
 
 
-class CategoryNotFoundException(JagritiAPIException):
-    """Raised when requested category is not found"""
-    
-    def __init__(self, category_name: str):
-        message = f"Category '{category_name}' not found"
-        super().__init__(message, 404)
+def _not_found(kind: str) -> type:
+    """Build the NotFoundException subclass for one kind of lookup"""
+    return type(f"{kind}NotFoundException", (NotFoundException,), {
+        "kind": kind,
+        "__doc__": f"Raised when requested {kind.lower()} is not found"
+    })
 
 
-class JudgeNotFoundException(JagritiAPIException):
-    """Raised when requested judge is not found"""
-    
-    def __init__(self, judge_name: str):
-        message = f"Judge '{judge_name}' not found"
-        super().__init__(message, 404)
+StateNotFoundException = _not_found("State")
+CommissionNotFoundException = _not_found("Commission")
+CategoryNotFoundException = _not_found("Category")
+JudgeNotFoundException = _not_found("Judge")
 
 
 class InvalidSearchTypeException(JagritiAPIException):
@@ -64,6 +57,22 @@ class InvalidSearchTypeException(JagritiAPIException):
         super().__init__(message, 400)
 
 
+class InvalidCursorException(JagritiAPIException):
+    """Raised when a pagination cursor cannot be decoded"""
+    
+    def __init__(self, cursor: str):
+        message = f"Invalid pagination cursor '{cursor}'"
+        super().__init__(message, 400)
+
+
+class PageSizeException(JagritiAPIException):
+    """Raised when a page larger than the default is requested without a date range"""
+    
+    def __init__(self, size: int, default_size: int):
+        message = f"size {size} greater than {default_size} requires both from_date and to_date"
+        super().__init__(message, 422)
+
+
 class CaseDataException(JagritiAPIException):
     """Raised when case data processing fails"""
     
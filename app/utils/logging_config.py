@@ -1,31 +1,49 @@
+import atexit
 import logging
+import queue
 import sys
-from datetime import datetime
-from app.config import get_settings
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, WatchedFileHandler
+from app.config import settings
 
-def setup_logging():
-    """Configure logging for the application"""
-    settings = get_settings()
+# Format: [TIMESTAMP] [LEVEL] [MODULE] MESSAGE
+LOG_FORMAT = '[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class ColorFormatter(logging.Formatter):
+    """Console formatter that colors the level name (timestamp comes from the base %(asctime)s handling)"""
+    
+    LEVEL_COLORS = {
+        'DEBUG': '\033[36m',    # Cyan
+        'INFO': '\033[32m',     # Green
+        'WARNING': '\033[33m',  # Yellow
+        'ERROR': '\033[31m',    # Red
+        'CRITICAL': '\033[35m', # Magenta
+    }
+    RESET_COLOR = '\033[0m'
     
-    class CustomFormatter(logging.Formatter):
-        def format(self, record):
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            level_colors = {
-                'DEBUG': '\033[36m',    # Cyan
-                'INFO': '\033[32m',     # Green  
-                'WARNING': '\033[33m',  # Yellow
-                'ERROR': '\033[31m',    # Red
-                'CRITICAL': '\033[35m', # Magenta
-            }
-            reset_color = '\033[0m'
-            
-            level_name = record.levelname
-            color = level_colors.get(level_name, '')
-            
-            # Format: [TIMESTAMP] [LEVEL] [MODULE] MESSAGE
-            formatted_message = f"[{timestamp}] {color}[{level_name}]{reset_color} [{record.name}] {record.getMessage()}"
-            return formatted_message
+    def __init__(self, fmt=None, datefmt=None, use_color=True):
+        super().__init__(fmt, datefmt=datefmt)
+        self.use_color = use_color
+        # Per-level copies of this formatter's own format with the level name wrapped in its color,
+        # so the colored and plain layouts cannot drift apart
+        self.level_styles = {
+            level: logging.PercentStyle(
+                self._style._fmt.replace('%(levelname)s', f'{color}%(levelname)s{self.RESET_COLOR}')
+            )
+            for level, color in self.LEVEL_COLORS.items()
+        } if use_color else {}
     
+    def formatMessage(self, record):
+        # Plain output (no escape codes) when the stream is not a terminal or the level has no color
+        style = self.level_styles.get(record.levelname)
+        if style is None:
+            return super().formatMessage(record)
+        return style.format(record)
+
+
+def setup_logging():
+    """Configure logging for the application"""
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
@@ -37,24 +55,33 @@ def setup_logging():
     # Console handler with UTF-8 encoding
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
-    console_handler.setFormatter(CustomFormatter())
+    # Colorize only when writing to a terminal, decided once at setup
+    use_color = sys.stdout.isatty()
+    console_handler.setFormatter(ColorFormatter(LOG_FORMAT, datefmt=DATE_FORMAT, use_color=use_color))
     # Set UTF-8 encoding for Windows compatibility
     if hasattr(console_handler.stream, 'reconfigure'):
         try:
             console_handler.stream.reconfigure(encoding='utf-8', errors='replace')
         except Exception:
             pass
-    root_logger.addHandler(console_handler)
     
-    # File handler for detailed logs with UTF-8 encoding
-    file_handler = logging.FileHandler('jagriti_api.log', encoding='utf-8')
+    # File handler for detailed logs with UTF-8 encoding. In-process rotation (10 MB, 5 backups kept)
+    # assumes a single process: with several workers one would rename the file while the others keep
+    # writing to the renamed backup, so multi-worker deployments reopen the file after logrotate moves it.
+    if settings.LOG_EXTERNAL_ROTATION:
+        file_handler = WatchedFileHandler('jagriti_api.log', encoding='utf-8')
+    else:
+        file_handler = RotatingFileHandler('jagriti_api.log', maxBytes=10_000_000, backupCount=5, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter(
-        '[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    file_formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
+    
+    # Console and file writes happen on the listener's thread; logging calls only enqueue
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # flush queued records on exit
+    root_logger.addHandler(QueueHandler(log_queue))
     
     # Set specific logger levels
     logging.getLogger("httpx").setLevel(logging.WARNING)  
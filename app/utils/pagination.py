@@ -0,0 +1,23 @@
+"""Opaque pagination cursors for case search results"""
+import base64
+import binascii
+from typing import Tuple
+import orjson
+from app.utils.exceptions import InvalidCursorException
+
+
+def encode_cursor(page: int, size: int) -> str:
+    """Encode the position of the next page as an opaque URL-safe token"""
+    return base64.urlsafe_b64encode(orjson.dumps({"p": page, "s": size})).decode("ascii")
+
+
+def decode_cursor(cursor: str, max_size: int) -> Tuple[int, int]:
+    """Decode a cursor produced by encode_cursor into (page, size)"""
+    try:
+        data = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        page, size = int(data["p"]), int(data["s"])
+    except (binascii.Error, orjson.JSONDecodeError, UnicodeEncodeError, KeyError, TypeError, ValueError):
+        raise InvalidCursorException(cursor)
+    if page < 0 or not 1 <= size <= max_size:
+        raise InvalidCursorException(cursor)
+    return page, size